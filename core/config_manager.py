@@ -99,6 +99,7 @@ class ConfigManager:
             "app_settings": {
                 "log_level": "INFO",
                 "max_log_files": 30,
+                "max_log_lines": 5000,
                 "theme": "default",
                 "window_size": "1024x768",
                 "auto_backup": True,
@@ -209,6 +210,14 @@ class ConfigManager:
         """
         return list(self.config_data.get("profiles", {}).keys())
     
+    def get_all_profiles(self) -> Dict[str, Dict[str, Any]]:
+        """Obtiene todos los perfiles de una vez.
+        
+        Returns:
+            Diccionario nombre -> configuración del perfil (sin copiar)
+        """
+        return self.config_data.get("profiles", {})
+    
     def get_app_setting(self, setting_name: str, default_value: Any = None) -> Any:
         """Obtiene una configuración de la aplicación.
         
@@ -241,6 +250,26 @@ class ConfigManager:
             print(f"Error al establecer configuración {setting_name}: {e}")
             return False
     
+    def set_update_setting(self, setting_name: str, value: Any) -> bool:
+        """Establece una opción del sistema de actualizaciones.
+        
+        Args:
+            setting_name: Nombre de la opción
+            value: Valor a establecer
+            
+        Returns:
+            True si se guardó correctamente, False en caso contrario
+        """
+        try:
+            if "updates" not in self.config_data:
+                self.config_data["updates"] = {}
+            
+            self.config_data["updates"][setting_name] = value
+            return self.save_config()
+        except Exception as e:
+            print(f"Error al establecer opción de actualizaciones {setting_name}: {e}")
+            return False
+    
     def get_naming_patterns(self) -> Dict[str, str]:
         """Obtiene todos los patrones de nomenclatura disponibles.
         
@@ -159,6 +159,104 @@ class FileManager:
             self._log('ERROR', f'Error al escanear directorio: {e}')
             return []
     
+    def scan_and_stat(self, directory: Path, include_subfolders: bool = False,
+                      file_filters: List[str] = None) -> Dict[str, any]:
+        """Escanea un directorio y calcula sus estadísticas en una sola pasada.
+        
+        Equivale a get_file_statistics(scan_directory(...)) pero recorre el
+        árbol con os.scandir y acumula los totales sin construir la lista de
+        FileInfo, reutilizando el stat cacheado de cada entrada.
+        
+        Args:
+            directory: Directorio a escanear
+            include_subfolders: Si incluir subdirectorios
+            file_filters: Lista de patrones de archivos (ej: ['*.pdf', '*.jpg'])
+            
+        Returns:
+            Diccionario con el mismo formato que get_file_statistics
+        """
+        total_files = 0
+        total_size = 0
+        extensions: Dict[str, int] = {}
+        largest = None
+        smallest = None
+        
+        if not directory.exists():
+            self._log('ERROR', f'El directorio no existe: {directory}')
+        elif not directory.is_dir():
+            self._log('ERROR', f'La ruta no es un directorio: {directory}')
+        else:
+            file_filters = file_filters or ['*']
+            for entry in self._iter_file_entries(directory, include_subfolders):
+                if not self._matches_filters(entry.name, file_filters):
+                    continue
+                if not os.access(entry.path, os.R_OK):
+                    self._log('WARNING', f'Archivo no legible: {entry.name}', entry.path)
+                    continue
+                
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = 0
+                
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext == '.':
+                    ext = ''
+                ext = ext or 'sin_extension'
+                extensions[ext] = extensions.get(ext, 0) + 1
+                
+                total_files += 1
+                total_size += size
+                if largest is None or size > largest[1]:
+                    largest = (entry.name, size, entry.path)
+                if smallest is None or size < smallest[1]:
+                    smallest = (entry.name, size, entry.path)
+            
+            self._log('INFO', f'Encontrados {total_files} archivos en {directory}')
+        
+        return {
+            'total_files': total_files,
+            'total_size': total_size,
+            'average_size': total_size // total_files if total_files else 0,
+            'extensions': extensions,
+            'largest_file': {
+                'name': largest[0],
+                'size': largest[1],
+                'path': largest[2]
+            } if largest else None,
+            'smallest_file': {
+                'name': smallest[0],
+                'size': smallest[1],
+                'path': smallest[2]
+            } if smallest else None
+        }
+    
+    def _iter_file_entries(self, directory: Path,
+                           include_subfolders: bool) -> Generator[os.DirEntry, None, None]:
+        """Genera las entradas de archivo de un directorio en el orden de scan_directory.
+        
+        Args:
+            directory: Directorio a recorrer
+            include_subfolders: Si descender a subdirectorios
+            
+        Yields:
+            os.DirEntry de cada archivo encontrado
+        """
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            yield entry
+                        elif include_subfolders and entry.is_dir():
+                            yield from self._iter_file_entries(entry.path, include_subfolders)
+                    except OSError:
+                        continue
+        except PermissionError:
+            self._log('WARNING', f'Sin permisos para acceder a: {directory}')
+        except OSError as e:
+            self._log('ERROR', f'Error al procesar directorio {directory}: {e}')
+    
     def _matches_filters(self, filename: str, filters: List[str]) -> bool:
         """Verifica si un archivo coincide con los filtros especificados.
         
@@ -11,10 +11,12 @@ import logging
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 import threading
 import queue
-from dataclasses import dataclass, field
+import math
+import time
+from dataclasses import dataclass, field, fields
 
 
 @dataclass
@@ -32,6 +34,18 @@ class SessionStats:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     
+    # Origen monotónico y última duración calculada (instante, duración)
+    _start_monotonic: float = field(default=0.0, init=False, repr=False, compare=False)
+    _cached_end: Optional[Tuple[float, timedelta]] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Intervalo mínimo entre recálculos de la duración de una sesión activa
+    DURATION_REFRESH_SECONDS = 0.5
+    
+    def __post_init__(self):
+        # Alinear el reloj monotónico con start_time una única vez
+        elapsed = (datetime.now() - self.start_time).total_seconds()
+        self._start_monotonic = time.monotonic() - elapsed
+    
     @property
     def success_rate(self) -> float:
         """Calcula la tasa de éxito."""
@@ -48,9 +62,28 @@ class SessionStats:
     
     @property
     def duration(self) -> timedelta:
-        """Calcula la duración de la sesión."""
-        end = self.end_time or datetime.now()
-        return end - self.start_time
+        """Calcula la duración de la sesión.
+        
+        Una sesión finalizada memoriza su duración; una sesión activa la
+        recalcula con el reloj monotónico como mucho cada medio segundo.
+        """
+        cached = self._cached_end
+        if self.end_time is not None:
+            if cached is None or cached[0] != math.inf:
+                cached = (math.inf, self.end_time - self.start_time)
+                self._cached_end = cached
+            return cached[1]
+        
+        now = time.monotonic()
+        if cached is None or now - cached[0] > self.DURATION_REFRESH_SECONDS:
+            cached = (now, timedelta(seconds=now - self._start_monotonic))
+            self._cached_end = cached
+        return cached[1]
+
+
+# Campos de SessionStats actualizables desde update_session_stats
+_STATS_FIELDS = frozenset(f.name for f in fields(SessionStats) if not f.name.startswith('_'))
+_STATS_LIST_FIELDS = frozenset({'errors', 'warnings'})
 
 
 class CustomFormatter(logging.Formatter):
@@ -91,6 +124,71 @@ class CustomFormatter(logging.Formatter):
         return formatted
 
 
+class ColorConsoleHandler(logging.StreamHandler):
+    """Handler de consola que aplica los colores ANSI ya codificados.
+    
+    Cuando la salida es una terminal, escribe bytes directamente en el buffer
+    del stream con las secuencias de color precodificadas por nivel, tras
+    vaciar la capa de texto para conservar el orden de la salida.
+    """
+    
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self.setFormatter(CustomFormatter(use_colors=False))
+        
+        colors = CustomFormatter.COLORS
+        reset = colors['RESET']
+        self._wrap_str = {level: (color, reset + self.terminator)
+                          for level, color in colors.items() if level != 'RESET'}
+        self._wrap_bytes = {level: (pre.encode('ascii'), post.encode('ascii'))
+                            for level, (pre, post) in self._wrap_str.items()}
+        self._plain_bytes = (b'', self.terminator.encode('ascii'))
+        
+        # Solo se escribe en binario sobre terminales con buffer accesible
+        is_tty = getattr(self.stream, 'isatty', None)
+        self._buffer = getattr(self.stream, 'buffer', None) if is_tty and is_tty() else None
+    
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+            buffer = self._buffer
+            if buffer is not None:
+                pre, post = self._wrap_bytes.get(record.levelname, self._plain_bytes)
+                # Vaciar antes la capa de texto para no adelantar este registro
+                # a lo que ya estuviera escrito en ella (print, otros handlers)
+                self.stream.flush()
+                buffer.write(pre)
+                buffer.write(msg.encode('utf-8'))
+                buffer.write(post)
+                buffer.flush()
+            else:
+                pre, post = self._wrap_str.get(record.levelname, ('', self.terminator))
+                self.stream.write(f"{pre}{msg}{post}")
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class Utf8FileHandler(logging.FileHandler):
+    """Handler de archivo que escribe los registros ya codificados en UTF-8.
+    
+    El archivo se abre en modo binario para evitar la capa de texto
+    (codificación y traducción de saltos de línea) en cada registro.
+    """
+    
+    def __init__(self, filename):
+        super().__init__(filename, mode='ab', encoding=None)
+    
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record).encode('utf-8') + b'\n')
+            self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
 class CustomLogger:
     """Sistema de logging personalizado con funcionalidades avanzadas."""
     
@@ -108,6 +206,8 @@ class CustomLogger:
         # Configuración
         self.max_log_files = 30
         self.log_level = logging.INFO
+        self.cleanup_interval = 3600  # Segundos entre limpiezas de logs antiguos
+        self._next_cleanup = time.monotonic() + self.cleanup_interval
         
         # Estadísticas de sesión
         self.current_session: Optional[SessionStats] = None
@@ -121,6 +221,13 @@ class CustomLogger:
         # Callbacks para la UI
         self.ui_callbacks: List[Callable[[str, str, str], None]] = []
         
+        # Despacho de log_file_operation según el estado
+        self._status_handlers = {
+            'success': self._log_success,
+            'error': self._log_error,
+            'skip': self._log_skip
+        }
+        
         # Configurar logger
         self._setup_logger()
         self._start_log_thread()
@@ -135,15 +242,13 @@ class CustomLogger:
         self.logger.handlers.clear()
         
         # Handler para consola
-        console_handler = logging.StreamHandler()
+        console_handler = ColorConsoleHandler()
         console_handler.setLevel(self.log_level)
-        console_formatter = CustomFormatter(use_colors=True)
-        console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
         
         # Handler para archivo
         log_file = self.log_dir / f"compression_{datetime.now().strftime('%Y-%m-%d')}.log"
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = Utf8FileHandler(log_file)
         file_handler.setLevel(self.log_level)
         file_formatter = CustomFormatter(use_colors=False)
         file_handler.setFormatter(file_formatter)
@@ -166,6 +271,11 @@ class CustomLogger:
     def _log_worker(self):
         """Worker para procesamiento asíncrono de logs."""
         while not self.stop_logging.is_set():
+            # Limpieza periódica de logs para procesos de larga duración
+            if time.monotonic() >= self._next_cleanup:
+                self._next_cleanup = time.monotonic() + self.cleanup_interval
+                self.cleanup_old_logs()
+            
             try:
                 # Obtener mensaje de la queue con timeout
                 log_item = self.log_queue.get(timeout=1.0)
@@ -286,12 +396,13 @@ class CustomLogger:
         if not self.current_session:
             return
         
+        # Escritura directa sobre __dict__ con nombres precalculados
+        stats_dict = self.current_session.__dict__
         for key, value in kwargs.items():
-            if hasattr(self.current_session, key):
-                if key in ['errors', 'warnings'] and isinstance(value, str):
-                    getattr(self.current_session, key).append(value)
-                else:
-                    setattr(self.current_session, key, value)
+            if key in _STATS_LIST_FIELDS and isinstance(value, str):
+                stats_dict[key].append(value)
+            elif key in _STATS_FIELDS:
+                stats_dict[key] = value
     
     def log_file_operation(self, operation: str, file_path: str, status: str, 
                           original_size: int = 0, compressed_size: int = 0, 
@@ -306,48 +417,65 @@ class CustomLogger:
             compressed_size: Tamaño comprimido
             error_msg: Mensaje de error si aplica
         """
-        file_name = Path(file_path).name
+        handler = self._status_handlers.get(status)
+        if handler is not None:
+            handler(operation, file_path, original_size, compressed_size, error_msg)
+    
+    def _log_success(self, operation: str, file_path: str, original_size: int,
+                     compressed_size: int, error_msg: Optional[str]):
+        """Registra una operación de archivo exitosa."""
+        file_name = os.path.basename(file_path)
+        if compressed_size > 0 and original_size > 0:
+            ratio = (1 - (compressed_size / original_size)) * 100
+            message = f'{operation.upper()} - {file_name} (Reducido {ratio:.1f}%)'
+        else:
+            message = f'{operation.upper()} - {file_name}'
+        
+        self.log_operation('SUCCESS', message, file_path)
+        
+        # Actualizar estadísticas
+        session = self.current_session
+        if session is not None:
+            stats_dict = session.__dict__
+            stats_dict['processed_files'] += 1
+            stats_dict['total_original_size'] += original_size
+            stats_dict['total_compressed_size'] += compressed_size
+    
+    def _log_error(self, operation: str, file_path: str, original_size: int,
+                   compressed_size: int, error_msg: Optional[str]):
+        """Registra una operación de archivo fallida."""
+        file_name = os.path.basename(file_path)
+        message = f'ERROR - {file_name}'
+        if error_msg:
+            message += f': {error_msg}'
         
-        if status == 'success':
-            if compressed_size > 0 and original_size > 0:
-                ratio = (1 - (compressed_size / original_size)) * 100
-                message = f'{operation.upper()} - {file_name} (Reducido {ratio:.1f}%)'
-            else:
-                message = f'{operation.upper()} - {file_name}'
-            
-            self.log_operation('SUCCESS', message, file_path)
-            
-            # Actualizar estadísticas
-            if self.current_session:
-                self.current_session.processed_files += 1
-                self.current_session.total_original_size += original_size
-                self.current_session.total_compressed_size += compressed_size
-        
-        elif status == 'error':
-            message = f'ERROR - {file_name}'
+        self.log_operation('ERROR', message, file_path)
+        
+        # Actualizar estadísticas
+        session = self.current_session
+        if session is not None:
+            stats_dict = session.__dict__
+            stats_dict['failed_files'] += 1
             if error_msg:
-                message += f': {error_msg}'
-            
-            self.log_operation('ERROR', message, file_path)
-            
-            # Actualizar estadísticas
-            if self.current_session:
-                self.current_session.failed_files += 1
-                if error_msg:
-                    self.current_session.errors.append(f'{file_name}: {error_msg}')
-        
-        elif status == 'skip':
-            message = f'SKIP - {file_name}'
+                stats_dict['errors'].append(f'{file_name}: {error_msg}')
+    
+    def _log_skip(self, operation: str, file_path: str, original_size: int,
+                  compressed_size: int, error_msg: Optional[str]):
+        """Registra una operación de archivo omitida."""
+        file_name = os.path.basename(file_path)
+        message = f'SKIP - {file_name}'
+        if error_msg:
+            message += f': {error_msg}'
+        
+        self.log_operation('WARNING', message, file_path)
+        
+        # Actualizar estadísticas
+        session = self.current_session
+        if session is not None:
+            stats_dict = session.__dict__
+            stats_dict['skipped_files'] += 1
             if error_msg:
-                message += f': {error_msg}'
-            
-            self.log_operation('WARNING', message, file_path)
-            
-            # Actualizar estadísticas
-            if self.current_session:
-                self.current_session.skipped_files += 1
-                if error_msg:
-                    self.current_session.warnings.append(f'{file_name}: {error_msg}')
+                stats_dict['warnings'].append(f'{file_name}: {error_msg}')
     
     def get_session_stats(self) -> Optional[Dict[str, Any]]:
         """Obtiene las estadísticas de la sesión actual.
@@ -389,8 +517,16 @@ class CustomLogger:
         for handler in self.logger.handlers:
             handler.setLevel(log_level)
     
-    def cleanup_old_logs(self):
-        """Limpia logs antiguos según la configuración."""
+    def cleanup_old_logs(self) -> List[Path]:
+        """Limpia logs antiguos según la configuración.
+        
+        Los eventos se escriben directamente en los handlers, sin pasar por
+        la cola asíncrona, para que la limpieza sea segura durante el cierre.
+        
+        Returns:
+            Lista de archivos de log eliminados
+        """
+        deleted = []
         try:
             log_files = list(self.log_dir.glob("compression_*.log"))
             log_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
@@ -398,10 +534,15 @@ class CustomLogger:
             # Mantener solo los archivos más recientes
             for old_log in log_files[self.max_log_files:]:
                 old_log.unlink()
-                self.log_operation('INFO', f'Log antiguo eliminado: {old_log.name}')
+                deleted.append(old_log)
+            
+            if deleted:
+                self.logger.info(f'Logs antiguos eliminados: {len(deleted)}')
         
         except Exception as e:
-            self.log_operation('ERROR', f'Error al limpiar logs antiguos: {e}')
+            self.logger.error(f'Error al limpiar logs antiguos: {e}')
+        
+        return deleted
     
     def export_session_report(self, session_stats: SessionStats, export_path: str) -> bool:
         """Exporta un reporte detallado de la sesión.
@@ -459,7 +600,7 @@ class CustomLogger:
         if self.log_thread and self.log_thread.is_alive():
             self.log_thread.join(timeout=5.0)
         
-        # Limpiar logs antiguos
+        # Limpiar logs antiguos (síncrono, el hilo ya está detenido)
         self.cleanup_old_logs()
         
-        self.log_operation('INFO', 'Sistema de logging cerrado')
\ No newline at end of file
+        self.logger.info('Sistema de logging cerrado')
\ No newline at end of file
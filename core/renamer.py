@@ -11,14 +11,75 @@ y más, manteniendo siempre las extensiones de archivo.
 
 import os
 import re
+import fnmatch
 import logging
+from array import array
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Callable, Iterator, Union
 from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from utils.rename_operations import NumberingHelper
+from utils.helpers import FileUtils
+from core.renamer_async import walk as walk_folder
 
-@dataclass
+
+# Caracteres no permitidos en nombres de archivo
+_INVALID_TABLE = str.maketrans({c: '\x00' for c in '<>:"/\\|?*'})
+
+# Motivos de conflicto/estado en la vista previa
+REASON_UNCHANGED = "Sin cambios"
+REASON_EXISTS = "El archivo ya existe"
+REASON_DUPLICATE = "Nombre duplicado en el lote"
+
+# Funciones de cambio de mayúsculas/minúsculas por tipo
+_CASE_FUNCTIONS = {
+    'lower': str.lower,
+    'upper': str.upper,
+    'title': str.title,
+    'sentence': str.capitalize
+}
+
+
+# Secuencias de dígitos para agregar o quitar ceros a la izquierda
+_DIGITS_RE = re.compile(r'\d+')
+
+
+def _strip_zeros(match: re.Match) -> str:
+    """Quita los ceros a la izquierda de un número (como NumberingHelper.remove_padding)"""
+    return str(int(match.group()))
+
+
+def compile_file_filters(file_filters: List[str]) -> re.Pattern:
+    """Compila filtros tipo glob en una sola expresión regular
+    
+    Igual que fnmatch: sin distinguir mayúsculas donde el sistema no lo hace.
+    """
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    return re.compile('|'.join(fnmatch.translate(pattern) for pattern in file_filters), flags)
+
+
+@lru_cache(maxsize=64)
+def _char_table(old: str, new: str) -> Dict[int, str]:
+    """Tabla de str.translate para sustituir un único carácter en una pasada"""
+    return str.maketrans({old: new})
+
+
+def _is_noop_operation(operation: 'RenameOperation') -> bool:
+    """Indica si una operación dejaría el nombre sin cambios"""
+    op_type = operation.operation_type
+    if op_type in ('prefix', 'suffix', 'remove'):
+        return not operation.value
+    if op_type == 'replace':
+        return not operation.old_value or operation.old_value == operation.value
+    if op_type == 'case':
+        return operation.case_type not in _CASE_FUNCTIONS
+    return False
+
+
+@dataclass(slots=True)
 class RenameOperation:
     """Representa una operación de renombrado"""
     operation_type: str  # 'prefix', 'suffix', 'replace', 'remove', 'numbering', 'case', 'padding'
@@ -32,7 +93,7 @@ class RenameOperation:
     position: int = 0  # Posición en la lista de operaciones
 
 
-@dataclass
+@dataclass(slots=True)
 class FileRenamePreview:
     """Representa la vista previa de un archivo a renombrar"""
     original_path: str
@@ -42,7 +103,10 @@ class FileRenamePreview:
     has_conflict: bool = False
     conflict_reason: str = ""
     size: int = 0
+    size_text: str = ""  # Tamaño ya formateado para mostrar
     modified_date: datetime = None
+    parent_dir: str = ""
+    new_path: str = ""  # Ruta completa de destino
 
 
 class FileRenamer:
@@ -51,8 +115,15 @@ class FileRenamer:
     def __init__(self, logger=None):
         self.logger = logger or logging.getLogger(__name__)
         self.operations: List[RenameOperation] = []
-        self.files: List[str] = []
+        self._ops_dirty = False  # Las operaciones requieren reordenarse por posición
+        # Archivos cargados: rutas completas más columnas paralelas con la
+        # ruta ya separada (carpeta, nombre sin extensión y extensión) y los
+        # datos de stat leídos una sola vez al cargar
+        self._reset_columns()
         self.preview_cache: List[FileRenamePreview] = []
+        self.max_workers = 32  # Hilos máximos para aplicar renombrados
+        self._filters_key: Optional[Tuple[str, ...]] = None
+        self._filters_regex: Optional[re.Pattern] = None
         self.stats = {
             'total_files': 0,
             'renamed_files': 0,
@@ -60,12 +131,67 @@ class FileRenamer:
             'errors': 0
         }
     
+    @property
+    def files(self) -> List[str]:
+        """Rutas de los archivos cargados"""
+        return self._files
+    
+    @files.setter
+    def files(self, file_paths: List[str]) -> None:
+        self._reset_columns()
+        for file_path in file_paths:
+            if file_path not in self._files_set:
+                self._append_file(file_path)
+    
+    def _reset_columns(self) -> None:
+        """Vacía la lista de archivos y sus columnas"""
+        self._files: List[str] = []
+        self._files_set: set = set()  # Índice de self.files para búsquedas O(1)
+        self._parents: List[str] = []
+        self._stems: List[str] = []
+        self._exts: List[str] = []
+        self._sizes = array('q')
+        self._size_strs: List[str] = []
+        self._mtimes: List[Optional[datetime]] = []
+    
+    def _append_file(self, file_path: str, st: Optional[os.stat_result] = None) -> None:
+        """Agrega una ruta a la lista y a las columnas separadas
+        
+        Si no se recibe el stat del archivo se obtiene aquí, una sola vez.
+        """
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                st = None
+        
+        parent, name = os.path.split(file_path)
+        stem, ext = os.path.splitext(name)
+        self._files.append(file_path)
+        self._files_set.add(file_path)
+        self._parents.append(parent)
+        self._stems.append(stem)
+        self._exts.append(ext)
+        
+        size = st.st_size if st else 0
+        self._sizes.append(size)
+        self._size_strs.append(FileUtils.format_file_size(size))
+        self._mtimes.append(datetime.fromtimestamp(st.st_mtime) if st else None)
+    
     def add_operation(self, operation: RenameOperation) -> None:
         """Agrega una nueva operación de renombrado"""
         operation.position = len(self.operations)
         self.operations.append(operation)
+        self._ops_dirty = True
         self.logger.log_operation('INFO', f"Operación agregada: {operation.operation_type}")
     
+    def set_operations(self, operations: List[RenameOperation]) -> None:
+        """Reemplaza todas las operaciones, ya en el orden en que se aplican"""
+        for i, op in enumerate(operations):
+            op.position = i
+        self.operations = list(operations)
+        self._ops_dirty = False
+    
     def remove_operation(self, index: int) -> bool:
         """Elimina una operación por índice"""
         if 0 <= index < len(self.operations):
@@ -73,6 +199,7 @@ class FileRenamer:
             # Reajustar posiciones
             for i, op in enumerate(self.operations):
                 op.position = i
+            self._ops_dirty = True
             self.logger.log_operation('INFO', f"Operación eliminada: {removed.operation_type}")
             return True
         return False
@@ -87,48 +214,64 @@ class FileRenamer:
             for i, op in enumerate(reordered):
                 op.position = i
             self.operations = reordered
+            self._ops_dirty = True
             self.logger.log_operation('INFO', "Operaciones reordenadas exitosamente")
             return True
         except IndexError:
             return False
     
     def load_files_from_folder(self, folder_path: str, include_subfolders: bool = False, 
-                              file_filters: List[str] = None) -> int:
-        """Carga archivos desde una carpeta"""
-        self.files.clear()
-        folder = Path(folder_path)
+                              file_filters: Union[List[str], re.Pattern, None] = None) -> int:
+        """Carga archivos desde una carpeta
         
-        if not folder.exists() or not folder.is_dir():
+        Los filtros pueden ser una lista de patrones tipo glob o una
+        expresión ya compilada con compile_file_filters.
+        """
+        self.files = []
+        
+        # Un único stat para validar la carpeta; las rutas se manejan como str
+        if not os.path.isdir(folder_path):
             self.logger.log_operation('ERROR', f"Carpeta no válida: {folder_path}")
             return 0
         
-        file_filters = file_filters or ['*']
-        pattern = "**/*" if include_subfolders else "*"
-        
-        for filter_pattern in file_filters:
-            if include_subfolders:
-                files = folder.rglob(filter_pattern)
-            else:
-                files = folder.glob(filter_pattern)
-            
-            for file_path in files:
-                if file_path.is_file():
-                    self.files.append(str(file_path))
+        # Un solo recorrido y una sola expresión regular para todos los filtros;
+        # las subcarpetas se leen en paralelo (ver core.renamer_async) y el
+        # stat de cada DirEntry se pide solo para los archivos que pasan
+        if isinstance(file_filters, re.Pattern):
+            match_filter = file_filters.match
+        else:
+            match_filter = self._compile_filters(file_filters or ['*']).match
+        found_files = walk_folder(os.fspath(folder_path), include_subfolders, match_filter)
         
-        # Eliminar duplicados y ordenar
-        self.files = sorted(list(set(self.files)))
+        # Cada carpeta se visita una vez, así que no hay duplicados; solo se
+        # ordena para que la numeración siga el orden alfabético
+        found_files.sort(key=lambda item: item[0])
+        for file_path, st in found_files:
+            self._append_file(file_path, st)
         self.stats['total_files'] = len(self.files)
         
         self.logger.log_operation('INFO', f"Cargados {len(self.files)} archivos desde {folder_path}")
         return len(self.files)
     
+    def _compile_filters(self, file_filters: List[str]) -> re.Pattern:
+        """Compila los filtros tipo glob en una sola expresión regular
+        
+        El resultado se reutiliza mientras la lista de filtros no cambie.
+        """
+        key = tuple(file_filters)
+        if key != self._filters_key:
+            self._filters_regex = compile_file_filters(file_filters)
+            self._filters_key = key
+        return self._filters_regex
+    
     def add_files(self, file_paths: List[str]) -> int:
         """Agrega archivos específicos a la lista"""
         added = 0
         for file_path in file_paths:
             path = Path(file_path)
-            if path.exists() and path.is_file() and str(path) not in self.files:
-                self.files.append(str(path))
+            path_str = str(path)
+            if path_str not in self._files_set and path.is_file():
+                self._append_file(path_str)
                 added += 1
         
         self.stats['total_files'] = len(self.files)
@@ -137,17 +280,21 @@ class FileRenamer:
     
     def clear_files(self) -> None:
         """Limpia la lista de archivos"""
-        self.files.clear()
+        self.files = []
         self.preview_cache.clear()
         self.stats['total_files'] = 0
     
-    def _apply_single_operation(self, filename: str, operation: RenameOperation, 
+    def _apply_single_operation(self, name_stem: str, operation: RenameOperation, 
                                file_index: int = 0) -> str:
-        """Aplica una sola operación a un nombre de archivo"""
-        if not operation.enabled:
-            return filename
+        """Aplica una sola operación a un nombre de archivo sin extensión
+        
+        La extensión se separa una única vez por archivo antes de aplicar
+        las operaciones y se vuelve a unir al final.
+        """
+        if not operation.enabled or _is_noop_operation(operation):
+            return name_stem
         
-        name, ext = os.path.splitext(filename)
+        name = name_stem
         
         if operation.operation_type == 'prefix':
             name = operation.value + name
@@ -156,11 +303,15 @@ class FileRenamer:
             name = name + operation.value
         
         elif operation.operation_type == 'replace':
-            if operation.old_value:
+            if len(operation.old_value) == 1:
+                name = name.translate(_char_table(operation.old_value, operation.value))
+            else:
                 name = name.replace(operation.old_value, operation.value)
         
         elif operation.operation_type == 'remove':
-            if operation.value:
+            if len(operation.value) == 1:
+                name = name.translate(_char_table(operation.value, ""))
+            else:
                 name = name.replace(operation.value, "")
         
         elif operation.operation_type == 'numbering':
@@ -169,64 +320,184 @@ class FileRenamer:
             name = f"{number_str}_{name}"
         
         elif operation.operation_type == 'case':
-            if operation.case_type == 'lower':
-                name = name.lower()
-            elif operation.case_type == 'upper':
-                name = name.upper()
-            elif operation.case_type == 'title':
-                name = name.title()
-            elif operation.case_type == 'sentence':
-                name = name.capitalize()
+            name = _CASE_FUNCTIONS[operation.case_type](name)
         
         elif operation.operation_type == 'padding':
-            # Importar NumberingHelper para usar la función de padding
-            from utils.rename_operations import NumberingHelper
             name = NumberingHelper.pad_numbers(name, operation.padding_length)
         
         elif operation.operation_type == 'remove_padding':
-            # Importar NumberingHelper para usar la función de remove padding
-            from utils.rename_operations import NumberingHelper
             name = NumberingHelper.remove_padding(name)
         
-        return name + ext
+        return name
     
-    def generate_preview(self) -> List[FileRenamePreview]:
-        """Genera vista previa de todos los archivos con las operaciones aplicadas"""
-        self.preview_cache.clear()
+    def _compile_pipeline(self, operations: List[RenameOperation],
+                          batch: bool = False) -> Callable:
+        """Compila la lista de operaciones en una única función
         
-        # Ordenar operaciones por posición
-        sorted_operations = sorted(self.operations, key=lambda x: x.position)
+        Genera el código fuente de una función ``pipeline(name, index)`` con
+        una línea por operación activa, de modo que el bucle por archivo hace
+        una sola llamada en lugar de despachar cada operación. Los valores de
+        las operaciones se pasan como variables del espacio de nombres, nunca
+        interpolados en el código. Las operaciones desactivadas o sin efecto
+        se omiten al compilar.
         
-        for i, file_path in enumerate(self.files):
-            path = Path(file_path)
-            original_name = path.name
-            new_name = original_name
+        Con ``batch=True`` el bucle sobre los archivos queda dentro de la
+        función generada: ``pipeline(stems, exts)`` devuelve la lista de
+        nombres nuevos (con extensión) sin una llamada por archivo.
+        """
+        namespace: Dict[str, Any] = {}
+        body: List[str] = []
+        
+        for k, operation in enumerate(operations):
+            if not operation.enabled or _is_noop_operation(operation):
+                continue
+            
+            var = f'_op{k}'
+            op_type = operation.operation_type
+            
+            if op_type == 'prefix':
+                namespace[var] = operation.value
+                body.append(f'name = {var} + name')
+            
+            elif op_type == 'suffix':
+                namespace[var] = operation.value
+                body.append(f'name = name + {var}')
+            
+            elif op_type == 'replace':
+                old, new = operation.old_value, operation.value
+                if len(old) == 1:
+                    namespace[var] = _char_table(old, new)
+                    body.append(f'name = name.translate({var})')
+                else:
+                    namespace[var], namespace[var + '_new'] = old, new
+                    body.append(f'name = name.replace({var}, {var}_new)')
+            
+            elif op_type == 'remove':
+                value = operation.value
+                if len(value) == 1:
+                    namespace[var] = _char_table(value, "")
+                    body.append(f'name = name.translate({var})')
+                else:
+                    namespace[var] = value
+                    body.append(f'name = name.replace({var}, "")')
+            
+            elif op_type == 'numbering':
+                namespace[var], namespace[var + '_pad'] = operation.start_number, operation.padding
+                body.append(f'name = str({var} + index).zfill({var}_pad) + "_" + name')
             
-            # Aplicar todas las operaciones en orden
-            for operation in sorted_operations:
-                new_name = self._apply_single_operation(new_name, operation, i)
+            elif op_type == 'case':
+                namespace[var] = _CASE_FUNCTIONS[operation.case_type]
+                body.append(f'name = {var}(name)')
+            
+            # Ceros numéricos: mismo resultado que NumberingHelper, pero con
+            # la expresión ya compilada y la función de reemplazo creada
+            # una sola vez por lote
+            elif op_type == 'padding':
+                length = operation.padding_length
+                namespace[var] = _DIGITS_RE.sub
+                namespace[var + '_repl'] = lambda match, length=length: match.group().zfill(length)
+                body.append(f'name = {var}({var}_repl, name)')
+            
+            elif op_type == 'remove_padding':
+                namespace[var], namespace[var + '_repl'] = _DIGITS_RE.sub, _strip_zeros
+                body.append(f'name = {var}({var}_repl, name)')
+        
+        if batch:
+            lines = ['def pipeline(stems, exts):',
+                     '    result = []',
+                     '    append = result.append',
+                     '    for index, name in enumerate(stems):']
+            lines.extend('        ' + line for line in body)
+            lines.append('        append(name + exts[index])')
+            lines.append('    return result')
+        else:
+            lines = ['def pipeline(name, index):']
+            lines.extend('    ' + line for line in body)
+            lines.append('    return name')
+        
+        exec('\n'.join(lines), namespace)
+        return namespace['pipeline']
+    
+    def generate_preview(self) -> List[FileRenamePreview]:
+        """Genera vista previa de todos los archivos con las operaciones aplicadas
+        
+        Cada llamada crea una lista nueva, de modo que una vista previa ya
+        entregada a la interfaz no cambia si se genera otra en segundo plano.
+        """
+        self.preview_cache = list(self.iter_previews())
+        return self.preview_cache
+    
+    def iter_previews(self) -> Iterator[FileRenamePreview]:
+        """Genera las vistas previas una a una, sin guardarlas en memoria"""
+        # Ordenar operaciones por posición solo si cambiaron desde la última vez
+        if self._ops_dirty:
+            self.operations.sort(key=lambda x: x.position)
+            self._ops_dirty = False
+        sorted_operations = self.operations
+        
+        # Primera pasada: solo los nuevos nombres
+        files, parents, stems, exts = self._files, self._parents, self._stems, self._exts
+        sizes, size_strs, mtimes = self._sizes, self._size_strs, self._mtimes
+        
+        if any(op.enabled and not _is_noop_operation(op) for op in sorted_operations):
+            # Compilar las operaciones, con el bucle incluido, una sola vez
+            # para todo el lote
+            new_names = self._compile_pipeline(sorted_operations, batch=True)(stems, exts)
+        else:
+            # Ninguna operación cambia el nombre: se reutilizan los originales
+            new_names = list(map(str.__add__, stems, exts))
+        
+        # Segunda pasada: conflictos por búsqueda en sets (nombres existentes
+        # por directorio, leídos una sola vez, y destinos ya usados en el lote)
+        dir_index: Dict[str, set] = {}
+        claimed_targets = set()
+        
+        for i, file_path in enumerate(files):
+            parent, ext, new_name = parents[i], exts[i], new_names[i]
+            original_name = stems[i] + ext
+            new_path = os.path.join(parent, new_name)
             
-            # Crear preview
+            # Crear preview; tamaño y fecha vienen de la carga de archivos
             preview = FileRenamePreview(
                 original_path=file_path,
                 original_name=original_name,
                 new_name=new_name,
-                extension=path.suffix,
-                size=path.stat().st_size if path.exists() else 0,
-                modified_date=datetime.fromtimestamp(path.stat().st_mtime) if path.exists() else None
+                extension=ext,
+                parent_dir=parent,
+                new_path=new_path,
+                size=sizes[i],
+                size_text=size_strs[i],
+                modified_date=mtimes[i]
             )
             
-            # Verificar conflictos
-            new_path = path.parent / new_name
-            if new_path.exists() and str(new_path) != file_path:
-                preview.has_conflict = True
-                preview.conflict_reason = "El archivo ya existe"
-            elif new_name == original_name:
-                preview.conflict_reason = "Sin cambios"
+            if new_name == original_name:
+                preview.conflict_reason = REASON_UNCHANGED
+            else:
+                existing = dir_index.get(parent)
+                if existing is None:
+                    existing = dir_index[parent] = self._list_dir_names(parent or os.curdir)
+                normalized_new = os.path.normcase(new_name)
+                target_key = os.path.normcase(new_path)
+                
+                if normalized_new in existing and normalized_new != os.path.normcase(original_name):
+                    preview.has_conflict = True
+                    preview.conflict_reason = REASON_EXISTS
+                elif target_key in claimed_targets:
+                    preview.has_conflict = True
+                    preview.conflict_reason = REASON_DUPLICATE
+                else:
+                    claimed_targets.add(target_key)
             
-            self.preview_cache.append(preview)
-        
-        return self.preview_cache
+            yield preview
+    
+    @staticmethod
+    def _list_dir_names(directory: str) -> set:
+        """Obtiene los nombres (normalizados) de las entradas de un directorio"""
+        try:
+            with os.scandir(directory) as entries:
+                return {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            return set()
     
     def check_conflicts(self) -> Dict[str, List[str]]:
         """Verifica conflictos en el renombrado"""
@@ -236,29 +507,42 @@ class FileRenamer:
             'invalid_names': []
         }
         
-        new_names = []
+        # Los duplicados y archivos existentes ya se resolvieron al generar
+        # la vista previa; aquí solo se leen
+        duplicates = conflicts['duplicates']
+        existing_files = conflicts['existing_files']
+        invalid_names = conflicts['invalid_names']
+        
         for preview in self.preview_cache:
-            # Verificar nombres duplicados
-            if preview.new_name in new_names:
-                conflicts['duplicates'].append(preview.new_name)
-            else:
-                new_names.append(preview.new_name)
+            new_name = preview.new_name
             
-            # Verificar archivos existentes
             if preview.has_conflict:
-                conflicts['existing_files'].append(preview.new_name)
+                if preview.conflict_reason == REASON_DUPLICATE:
+                    duplicates.append(new_name)
+                else:
+                    existing_files.append(new_name)
             
             # Verificar nombres inválidos
-            invalid_chars = r'[<>:"/\|?*]'
-            if re.search(invalid_chars, preview.new_name):
-                conflicts['invalid_names'].append(preview.new_name)
+            if '\x00' in new_name.translate(_INVALID_TABLE):
+                invalid_names.append(new_name)
         
         return conflicts
     
-    def apply_rename(self, dry_run: bool = False) -> Dict[str, Any]:
-        """Aplica el renombrado a todos los archivos"""
-        if not self.preview_cache:
-            self.generate_preview()
+    def apply_rename(self, dry_run: bool = False,
+                     progress_callback: Optional[Callable[[int, int], None]] = None,
+                     previews: Optional[List[FileRenamePreview]] = None) -> Dict[str, Any]:
+        """Aplica el renombrado a todos los archivos
+        
+        Args:
+            dry_run: Solo simular, sin renombrar
+            progress_callback: Función opcional (renombrados, total) llamada
+                desde el hilo que aplica el renombrado tras cada archivo
+            previews: Vistas previas a aplicar (las confirmadas por el
+                usuario); por defecto, la última vista previa generada
+        """
+        if previews is None:
+            # Sin vista previa en caché se recorre el generador directamente
+            previews = self.preview_cache or self.iter_previews()
         
         results = {
             'success': [],
@@ -271,19 +555,22 @@ class FileRenamer:
         self.stats['skipped_files'] = 0
         self.stats['errors'] = 0
         
-        for preview in self.preview_cache:
+        # Clasificar primero: omitidos y renombrados pendientes
+        to_rename: List[Tuple[FileRenamePreview, str]] = []
+        
+        for preview in previews:
             results['total_processed'] += 1
             
             # Saltar si no hay cambios
             if preview.original_name == preview.new_name:
                 results['skipped'].append({
                     'file': preview.original_name,
-                    'reason': 'Sin cambios'
+                    'reason': REASON_UNCHANGED
                 })
                 self.stats['skipped_files'] += 1
                 continue
             
-            # Saltar si hay conflictos
+            # Saltar si hay conflictos (incluye destinos repetidos en el lote)
             if preview.has_conflict:
                 results['skipped'].append({
                     'file': preview.original_name,
@@ -292,36 +579,54 @@ class FileRenamer:
                 self.stats['skipped_files'] += 1
                 continue
             
-            if not dry_run:
-                try:
-                    old_path = Path(preview.original_path)
-                    new_path = old_path.parent / preview.new_name
-                    
-                    old_path.rename(new_path)
-                    
-                    results['success'].append({
-                        'old_name': preview.original_name,
-                        'new_name': preview.new_name,
-                        'path': str(new_path)
-                    })
-                    self.stats['renamed_files'] += 1
-                    
-                except Exception as e:
-                    error_msg = f"Error renombrando {preview.original_name}: {str(e)}"
-                    results['errors'].append({
-                        'file': preview.original_name,
-                        'error': error_msg
-                    })
-                    self.stats['errors'] += 1
-                    self.logger.log_operation('ERROR', error_msg)
-            else:
-                # Modo dry run - solo simular
+            to_rename.append((preview, preview.new_path))
+        
+        if dry_run:
+            # Modo dry run - solo simular
+            for preview, _ in to_rename:
                 results['success'].append({
                     'old_name': preview.original_name,
                     'new_name': preview.new_name,
                     'path': 'DRY RUN'
                 })
         
+        elif to_rename:
+            # Los renombrados son llamadas al sistema independientes; se
+            # solapan en un pool de hilos (os.rename libera el GIL)
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(to_rename))) as executor:
+                futures = {
+                    executor.submit(os.rename, preview.original_path, new_path): (preview, new_path)
+                    for preview, new_path in to_rename
+                }
+                
+                total = len(futures)
+                for done, future in enumerate(as_completed(futures), 1):
+                    preview, new_path = futures[future]
+                    if progress_callback:
+                        progress_callback(done, total)
+                    try:
+                        future.result()
+                        
+                        results['success'].append({
+                            'old_name': preview.original_name,
+                            'new_name': preview.new_name,
+                            'path': new_path
+                        })
+                        self.stats['renamed_files'] += 1
+                        
+                    except Exception as e:
+                        error_msg = f"Error renombrando {preview.original_name}: {str(e)}"
+                        results['errors'].append({
+                            'file': preview.original_name,
+                            'error': error_msg
+                        })
+                        self.stats['errors'] += 1
+        
+        # Un único registro de resumen en lugar de uno por archivo
+        if results['errors']:
+            self.logger.log_operation('ERROR', f"{len(results['errors'])} errores de renombrado; "
+                            f"primero: {results['errors'][0]['error']}")
+        
         self.logger.log_operation('INFO', f"Renombrado completado: {self.stats['renamed_files']} exitosos, "
                         f"{self.stats['skipped_files']} omitidos, {self.stats['errors']} errores")
         
@@ -334,7 +639,7 @@ class FileRenamer:
     def reset(self) -> None:
         """Reinicia el renombrador"""
         self.operations.clear()
-        self.files.clear()
+        self.files = []
         self.preview_cache.clear()
         self.stats = {
             'total_files': 0,
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Recorrido Asíncrono de Carpetas para el Renombrado Masivo
+Parte del sistema de Automatización de Compresión
+
+En unidades de red o montajes remotos cada lectura de directorio tiene
+mucha latencia y recorrerlos uno tras otro domina el tiempo de carga. Este
+módulo lee varios directorios a la vez: cada os.scandir se ejecuta en un
+hilo con asyncio.to_thread y un semáforo limita los directorios abiertos
+simultáneamente.
+"""
+
+import os
+import asyncio
+from typing import List, Tuple, Optional, Callable, Any
+
+
+# Directorios que se leen a la vez como máximo
+MAX_CONCURRENT_SCANS = 32
+
+# Archivo encontrado: ruta completa y su stat (None si no se pudo leer)
+FileEntry = Tuple[str, Optional[os.stat_result]]
+
+
+def scan_directory(directory: str, recursive: bool,
+                   match: Callable[[str], Any]) -> Tuple[List[FileEntry], List[str]]:
+    """Lee un único directorio
+
+    Args:
+        directory: Carpeta a leer
+        recursive: Si se devuelven las subcarpetas para seguir el recorrido
+        match: Función que indica si un nombre de archivo pasa el filtro
+
+    Returns:
+        Tupla (archivos que pasan el filtro con su stat, subcarpetas)
+    """
+    files: List[FileEntry] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    # El tipo sale de la propia lectura del directorio
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            subdirs.append(entry.path)
+                    elif entry.is_file() and match(entry.name):
+                        # Solo se pide el stat de los archivos que pasan
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            st = None
+                        files.append((entry.path, st))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+
+async def walk_async(root: str, include_subfolders: bool, match: Callable[[str], Any],
+                     max_concurrency: int = MAX_CONCURRENT_SCANS) -> List[FileEntry]:
+    """Recorre una carpeta leyendo sus subcarpetas en paralelo
+
+    Args:
+        root: Carpeta inicial
+        include_subfolders: Si se recorren las subcarpetas
+        match: Función que indica si un nombre de archivo pasa el filtro
+        max_concurrency: Directorios leídos a la vez como máximo
+
+    Returns:
+        Lista de archivos encontrados (ruta, stat), sin orden definido
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    found: List[FileEntry] = []
+
+    async def visit(directory: str) -> None:
+        async with semaphore:
+            files, subdirs = await asyncio.to_thread(
+                scan_directory, directory, include_subfolders, match)
+        found.extend(files)
+        if subdirs:
+            await asyncio.gather(*(visit(subdir) for subdir in subdirs))
+
+    await visit(root)
+    return found
+
+
+def walk(root: str, include_subfolders: bool, match: Callable[[str], Any],
+         max_concurrency: int = MAX_CONCURRENT_SCANS) -> List[FileEntry]:
+    """Versión síncrona de walk_async para hilos sin bucle de eventos
+
+    Sin subcarpetas solo hay un directorio que leer y se lee directamente.
+    """
+    if not include_subfolders:
+        return scan_directory(root, False, match)[0]
+    return asyncio.run(walk_async(root, True, match, max_concurrency))
@@ -11,24 +11,74 @@ Versión: 1.0
 Fecha: 2025
 """
 
+import io
 import os
 import sys
+import socket
 import json
 import hashlib
 import shutil
+import tarfile
 import zipfile
 import tempfile
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, Callable, Any, Tuple
+from typing import Dict, List, Optional, Callable, Any, Tuple, Iterator, Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 import requests
+from requests.adapters import HTTPAdapter
 from packaging import version
 
+try:
+    # Paquetes de actualización .tar.zst: más pequeños y rápidos de descomprimir (opcional)
+    import zstandard
+except ImportError:
+    zstandard = None
 
-@dataclass
+try:
+    # Parser/serializador JSON en C más rápido que json (opcional)
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Cabeceras comunes de la sesión HTTP
+REQUEST_HEADERS = {'User-Agent': 'AutomatizacionCompresion-Updater/1.0'}
+
+# Extensión de los paquetes de actualización comprimidos con zstd
+ZSTD_BUNDLE_SUFFIX = '.tar.zst'
+
+# Número mágico de una trama zstd
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Tamaño de bloque para descargas y cálculo de hashes
+CHUNK_SIZE = 1 << 20
+
+# Descarga en paralelo por rangos solo a partir de este tamaño
+PARALLEL_DOWNLOAD_MIN_SIZE = 4 * 1024 * 1024
+
+# Fechas de publicación recordadas para estimar el ritmo de releases
+RELEASE_HISTORY_SIZE = 10
+
+# Intervalo máximo entre verificaciones tras errores de red consecutivos
+MAX_CHECK_BACKOFF = timedelta(days=7)
+
+# Archivos que la aplicación modifica en el sitio: en respaldos y
+# restauraciones se copian en lugar de enlazarse
+MUTABLE_FILES = ('config.json',)
+
+# Tiempo máximo para comprobar que el servidor de actualizaciones es alcanzable
+REACHABILITY_TIMEOUT = 0.5
+
+# Hilos para copiar/extraer archivos en paralelo
+COPY_WORKERS = os.cpu_count() or 4
+
+
+@dataclass(slots=True, frozen=True)
 class UpdateInfo:
     """Información sobre una actualización disponible."""
     version: str
@@ -41,7 +91,7 @@ class UpdateInfo:
     min_version: str = "1.0.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateConfig:
     """Configuración del sistema de actualizaciones."""
     update_server_url: str
@@ -93,18 +143,39 @@ class Updater:
         self.temp_dir = Path(tempfile.gettempdir()) / "AutomatizacionCompresion_Updates"
         self.backup_dir = self.app_dir / "backup"
         self.version_file = self._get_resource_path("version.json")
+        # Estado entre ejecuciones (última verificación, caché HTTP...). No se
+        # guarda en version.json: en el ejecutable empaquetado está en _MEIPASS,
+        # que se extrae de nuevo en cada inicio
+        self.state_file = self.app_dir / "update_state.json"
         
         # Crear directorios necesarios
         self.temp_dir.mkdir(exist_ok=True)
         if self.config.backup_enabled:
             self.backup_dir.mkdir(exist_ok=True)
         
-        # Información de versión actual
-        self.current_version = self._get_current_version()
+        # Información de versión actual (el archivo se lee una sola vez)
+        self._version_data: Dict[str, Any] = {}
+        self._version_data = self._load_version_file()
+        self._state = self._load_state_file()
+        self.current_version = self._version_data.get('version', '1.0.0')
+        self._current_v = None  # (cadena, Version) de current_version ya analizada
+        
+        # Sesión HTTP compartida: reutiliza conexiones TCP/TLS entre la
+        # consulta de versiones, el HEAD y las descargas por rangos
+        self._session = requests.Session()
+        self._session.headers.update(REQUEST_HEADERS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
         
         # Estado de actualización
         self.is_updating = False
-        self.last_check = None
+        self.last_check = self._load_last_check()
+        self._failed_checks = 0
+    
+    def close(self):
+        """Cierra la sesión HTTP y sus conexiones abiertas."""
+        self._session.close()
         
     def _get_resource_path(self, filename: str) -> Path:
         """Obtiene la ruta correcta de un recurso, tanto en desarrollo como en ejecutable empaquetado."""
@@ -132,39 +203,108 @@ class Updater:
         if self.progress_callback:
             self.progress_callback(percentage, message)
     
-    def _get_current_version(self) -> str:
-        """Obtiene la versión actual de la aplicación."""
+    def _load_version_file(self) -> Dict[str, Any]:
+        """Lee el archivo de versión de la aplicación, creándolo si no existe."""
         try:
             if self.version_file.exists():
                 with open(self.version_file, 'r', encoding='utf-8') as f:
-                    version_data = json.load(f)
-                    return version_data.get('version', '1.0.0')
+                    return json.load(f)
             else:
                 # Crear archivo de versión inicial
                 self._save_version_info('1.0.0')
-                return '1.0.0'
+                return self._version_data
         except Exception as e:
             self._log('WARNING', f'Error al leer versión actual: {e}')
-            return '1.0.0'
+            return {}
+    
+    def _load_state_file(self) -> Dict[str, Any]:
+        """Lee el estado del actualizador guardado en la carpeta de la aplicación."""
+        try:
+            if self.state_file.exists():
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            self._log('WARNING', f'Error al leer estado del actualizador: {e}')
+        return {}
+    
+    def _load_last_check(self) -> Optional[datetime]:
+        """Lee la fecha de la última verificación guardada en el estado."""
+        value = self._state.get('last_check')
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            return None
+    
+    def _mark_checked(self):
+        """Registra que se completó una verificación y la guarda para el próximo inicio."""
+        self.last_check = datetime.now()
+        self._update_state({'last_check': self.last_check.isoformat(timespec='seconds')})
+    
+    def _parsed_current_version(self) -> version.Version:
+        """Devuelve current_version analizada, recalculándola solo si cambia."""
+        if self._current_v is None or self._current_v[0] != self.current_version:
+            self._current_v = (self.current_version, version.parse(self.current_version))
+        return self._current_v[1]
+    
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]):
+        """Escribe un diccionario como JSON de forma atómica."""
+        tmp_path = path.with_name(path.name + '.tmp')
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
+    def _write_version_data(self):
+        """Escribe los datos de versión en memoria de forma atómica."""
+        self._write_json(self.version_file, self._version_data)
     
     def _save_version_info(self, version_str: str, additional_info: Dict[str, Any] = None):
         """Guarda información de versión."""
         try:
-            version_data = {
+            # Se conservan los campos existentes (p. ej. update_history)
+            version_data = dict(self._version_data)
+            version_data.update({
                 'version': version_str,
                 'updated_at': datetime.now().isoformat(),
                 'app_name': 'Automatización de Compresión de Archivos'
-            }
+            })
             
             if additional_info:
                 version_data.update(additional_info)
             
-            with open(self.version_file, 'w', encoding='utf-8') as f:
-                json.dump(version_data, f, indent=2, ensure_ascii=False)
+            self._version_data = version_data
+            self._current_v = None
+            self._write_version_data()
                 
         except Exception as e:
             self._log('ERROR', f'Error al guardar información de versión: {e}')
     
+    def _update_state(self, fields: Dict[str, Any]):
+        """Actualiza campos del estado del actualizador conservando el resto."""
+        try:
+            self._state.update(fields)
+            self._write_json(self.state_file, self._state)
+                
+        except Exception as e:
+            self._log('ERROR', f'Error al guardar estado del actualizador: {e}')
+    
+    def _save_release_cache(self, check_url: str, response: Optional[requests.Response]):
+        """Guarda (o borra, si response es None) los validadores HTTP de la última consulta."""
+        cache = None
+        if response is not None:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                cache = {'url': check_url, 'etag': etag, 'last_modified': last_modified}
+        
+        if self._state.get('release_cache') != cache:
+            self._update_state({'release_cache': cache})
+    
     def check_for_updates(self, force: bool = False) -> Optional[UpdateInfo]:
         """Verifica si hay actualizaciones disponibles.
         
@@ -178,7 +318,7 @@ class Updater:
             # Verificar frecuencia de chequeo
             if not force and self.last_check:
                 time_since_check = datetime.now() - self.last_check
-                if time_since_check < timedelta(hours=self.config.check_frequency_hours):
+                if time_since_check < self._check_interval():
                     self._log('INFO', 'Verificación de actualizaciones omitida (muy reciente)')
                     return None
             
@@ -188,32 +328,58 @@ class Updater:
             # Usar la URL de releases/latest de GitHub directamente
             check_url = self.config.update_server_url.replace('/releases', '/releases/latest')
             
+            # Petición condicional si ya se consultó esta URL sin novedades;
+            # un 304 no trae cuerpo ni consume el límite de la API de GitHub
+            headers = {}
+            cache = self._state.get('release_cache') or {}
+            if cache.get('url') == check_url:
+                if cache.get('etag'):
+                    headers['If-None-Match'] = cache['etag']
+                if cache.get('last_modified'):
+                    headers['If-Modified-Since'] = cache['last_modified']
+            
             # Realizar solicitud HTTP a la API de GitHub
-            response = requests.get(
+            response = self._session.get(
                 check_url,
                 timeout=30,
-                headers={'User-Agent': 'AutomatizacionCompresion-Updater/1.0'}
+                headers=headers
             )
+            
+            if response.status_code == 304:
+                self._log('INFO', 'Sin cambios desde la última verificación')
+                self._failed_checks = 0
+                self._mark_checked()
+                self._report_progress(100, 'Verificación completada - Sin actualizaciones')
+                return None
+            
             response.raise_for_status()
+            self._failed_checks = 0
             
             self._report_progress(50, 'Procesando información de actualización...')
             
-            # Procesar respuesta de la API de GitHub
-            release_data = response.json()
+            # Procesar respuesta de la API de GitHub (bytes directamente, sin
+            # decodificar antes a str)
+            release_data = orjson.loads(response.content) if orjson is not None else json.loads(response.content)
+            
+            # Recordar la fecha del release para adaptar la frecuencia de consulta
+            self._record_release(release_data.get('published_at') or '')
             
             # Extraer información del release
             latest_version = release_data.get('tag_name', '').lstrip('v')
             
             if not latest_version:
                 self._log('INFO', 'No hay actualizaciones disponibles')
-                self.last_check = datetime.now()
+                self._save_release_cache(check_url, response)
+                self._mark_checked()
                 self._report_progress(100, 'Verificación completada - Sin actualizaciones')
                 return None
             
-            # Verificar si la versión es realmente más nueva
-            if version.parse(latest_version) <= version.parse(self.current_version):
+            # Verificar si la versión es realmente más nueva (la misma cadena,
+            # caso habitual, no necesita analizarse)
+            if latest_version == self.current_version or version.parse(latest_version) <= self._parsed_current_version():
                 self._log('INFO', f'Versión {latest_version} no es más nueva que {self.current_version}')
-                self.last_check = datetime.now()
+                self._save_release_cache(check_url, response)
+                self._mark_checked()
                 self._report_progress(100, 'Verificación completada - Sin actualizaciones')
                 return None
             
@@ -221,15 +387,19 @@ class Updater:
             download_url = None
             file_size = 0
             
-            for asset in release_data.get('assets', []):
-                if asset['name'].endswith('.zip'):
+            # Preferir el paquete .tar.zst si se puede descomprimir; si no, el ZIP
+            suffixes = (ZSTD_BUNDLE_SUFFIX, '.zip') if zstandard is not None else ('.zip',)
+            assets = release_data.get('assets', [])
+            for suffix in suffixes:
+                asset = next((a for a in assets if a['name'].endswith(suffix)), None)
+                if asset:
                     download_url = asset['browser_download_url']
                     file_size = asset.get('size', 0)
                     break
             
             if not download_url:
                 self._log('WARNING', 'No se encontró archivo ZIP en el release')
-                self.last_check = datetime.now()
+                self._mark_checked()
                 return None
             
             # Crear objeto UpdateInfo
@@ -245,17 +415,23 @@ class Updater:
             )
             
             # Verificar versión mínima requerida
-            if version.parse(self.current_version) < version.parse(update_info.min_version):
+            if self._parsed_current_version() < version.parse(update_info.min_version):
                 self._log('WARNING', f'Versión actual {self.current_version} es menor que la mínima requerida {update_info.min_version}')
             
+            # Sin caché: la próxima consulta debe volver a ver esta actualización
+            self._save_release_cache(check_url, None)
+            
             self._log('INFO', f'Actualización disponible: v{update_info.version}')
-            self.last_check = datetime.now()
+            self._mark_checked()
             self._report_progress(100, f'Actualización v{update_info.version} disponible')
             
             return update_info
             
         except requests.RequestException as e:
             self._log('ERROR', f'Error de conexión al verificar actualizaciones: {e}')
+            # Espaciar los reintentos automáticos (backoff exponencial)
+            self._failed_checks += 1
+            self._mark_checked()
             self._report_progress(100, 'Error de conexión')
             return None
         except Exception as e:
@@ -276,53 +452,63 @@ class Updater:
             self._log('INFO', f'Iniciando descarga de actualización v{update_info.version}')
             self._report_progress(0, 'Iniciando descarga...')
             
-            # Preparar archivo de destino
-            filename = f"update_v{update_info.version}.zip"
+            # Preparar archivo de destino; se descarga en un .part que solo
+            # pasa a .zip una vez validado
+            suffix = ZSTD_BUNDLE_SUFFIX if self._is_zstd_bundle(update_info.download_url) else '.zip'
+            filename = f"update_v{update_info.version}{suffix}"
             download_path = self.temp_dir / filename
+            part_path = self.temp_dir / f"{filename}.part"
             
             # Eliminar descarga anterior si existe
             if download_path.exists():
                 download_path.unlink()
             
-            # Descargar archivo
-            response = requests.get(
-                update_info.download_url,
-                stream=True,
-                timeout=300,
-                headers={'User-Agent': 'AutomatizacionCompresion-Updater/1.0'}
-            )
-            response.raise_for_status()
-            
-            # Obtener tamaño total
-            total_size = int(response.headers.get('content-length', 0))
-            if total_size == 0:
-                total_size = update_info.file_size
-            
-            # Descargar con progreso
-            downloaded = 0
-            with open(download_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if total_size > 0:
-                            progress = int((downloaded / total_size) * 80)  # 80% para descarga
-                            self._report_progress(progress, f'Descargando... {downloaded // 1024} KB')
+            # Bytes de una descarga interrumpida que se pueden reanudar
+            resume_from = part_path.stat().st_size if part_path.exists() else 0
+            
+            # Consultar tamaño y soporte de rangos antes de descargar; si el
+            # HEAD falla se descarga de forma secuencial como siempre
+            try:
+                head = self._session.head(
+                    update_info.download_url,
+                    allow_redirects=True,
+                    timeout=30
+                )
+                head_size = int(head.headers.get('content-length', 0)) if head.ok else 0
+                accepts_ranges = head.ok and head.headers.get('accept-ranges', '').lower() == 'bytes'
+            except (requests.RequestException, ValueError) as e:
+                self._log('WARNING', f'No se pudo consultar el tamaño de la descarga: {e}')
+                head_size = 0
+                accepts_ranges = False
+            
+            if accepts_ranges and head_size >= PARALLEL_DOWNLOAD_MIN_SIZE and not resume_from:
+                # Usar la URL final (tras redirecciones) para los rangos; los
+                # tramos llegan desordenados, así que el hash se calcula después
+                self._parallel_download(head.url, part_path, head_size)
+                digest = None
+            else:
+                # El hash se calcula a la vez que se escribe
+                digest = self._sequential_download(update_info, part_path, resume_from)
             
             self._report_progress(85, 'Validando descarga...')
             
             # Validar checksum si está disponible
             if update_info.checksum:
-                if not self._validate_checksum(download_path, update_info.checksum):
-                    download_path.unlink()
+                if not self._validate_checksum(part_path, update_info.checksum, digest):
+                    part_path.unlink()
                     raise ValidationError('Checksum de descarga no válido')
             
-            # Validar que es un archivo ZIP válido
-            if not self._validate_zip_file(download_path):
-                download_path.unlink()
+            # Validar que es un paquete válido
+            if suffix == ZSTD_BUNDLE_SUFFIX:
+                if not self._validate_zstd_file(part_path):
+                    part_path.unlink()
+                    raise ValidationError('Archivo descargado no es un paquete zstd válido')
+            elif not self._validate_zip_file(part_path):
+                part_path.unlink()
                 raise ValidationError('Archivo descargado no es un ZIP válido')
             
+            os.replace(part_path, download_path)
+            
             self._log('INFO', f'Descarga completada: {download_path}')
             self._report_progress(100, 'Descarga completada')
             
@@ -335,31 +521,203 @@ class Updater:
             self._log('ERROR', f'Error durante descarga: {e}')
             raise DownloadError(f'Error de descarga: {e}')
     
-    def _validate_checksum(self, file_path: Path, expected_checksum: str) -> bool:
-        """Valida el checksum de un archivo."""
+    def _sequential_download(self, update_info: UpdateInfo, download_path: Path, resume_from: int = 0) -> str:
+        """Descarga el archivo con una única petición secuencial.
+        
+        Si resume_from > 0 se pide solo el resto del archivo con Range y se
+        añade a lo ya descargado; si el servidor no lo admite se empieza de cero.
+        
+        Returns:
+            SHA-256 del archivo completo, calculado durante la descarga
+        """
+        headers = {'Range': f'bytes={resume_from}-'} if resume_from else None
+        response = self._session.get(
+            update_info.download_url,
+            stream=True,
+            timeout=300,
+            headers=headers
+        )
+        
+        if response.status_code == 416:
+            # El fragmento guardado no encaja con el archivo remoto
+            response.close()
+            response = self._session.get(
+                update_info.download_url,
+                stream=True,
+                timeout=300
+            )
+        response.raise_for_status()
+        
+        hasher = hashlib.sha256()
+        
+        if response.status_code == 206:
+            # Reanudar: el total viene en Content-Range ("bytes inicio-fin/total")
+            self._hash_file(download_path, hasher)
+            downloaded = resume_from
+            mode = 'r+b'
+            total = response.headers.get('content-range', '').rpartition('/')[2]
+            total_size = int(total) if total.isdigit() else 0
+            self._log('INFO', f'Reanudando descarga desde {resume_from // 1024} KB')
+        else:
+            # Descarga completa desde el principio
+            downloaded = 0
+            mode = 'wb'
+            total_size = int(response.headers.get('content-length', 0))
+        
+        # Obtener tamaño total
+        if total_size == 0:
+            total_size = update_info.file_size
+        
+        # Descargar con progreso; bloques grandes escritos sin búfer intermedio
+        with io.FileIO(download_path, mode) as f:
+            f.seek(downloaded)
+            if total_size > downloaded:
+                self._preallocate(f, total_size)
+            
+            try:
+                for chunk in response.raw.stream(CHUNK_SIZE, decode_content=True):
+                    self._write_all(f, chunk)
+                    hasher.update(chunk)
+                    downloaded += len(chunk)
+                    
+                    if total_size > 0:
+                        progress = int((downloaded / total_size) * 80)  # 80% para descarga
+                        self._report_progress(progress, f'Descargando... {downloaded // 1024} KB')
+            finally:
+                # Dejar solo los bytes escritos: si la descarga se corta, el
+                # .part sigue sirviendo para reanudar
+                f.truncate(downloaded)
+        
+        return hasher.hexdigest()
+    
+    def _parallel_download(self, url: str, path: Path, size: int, workers: int = 4):
+        """Descarga el archivo en paralelo con peticiones Range sobre tramos disjuntos.
+        
+        Args:
+            url: URL del archivo (debe aceptar rangos de bytes)
+            path: Ruta de destino
+            size: Tamaño total en bytes
+            workers: Número de conexiones simultáneas
+        """
+        # Reservar el tamaño completo para que cada hilo escriba en su tramo
+        with open(path, 'wb') as f:
+            self._preallocate(f, size)
+        
         try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            
-            actual_checksum = hash_md5.hexdigest()
+            self._download_ranges(url, path, size, workers)
+        except BaseException:
+            # El archivo tiene huecos: no sirve para reanudar
+            path.unlink(missing_ok=True)
+            raise
+    
+    def _download_ranges(self, url: str, path: Path, size: int, workers: int):
+        """Descarga los tramos de bytes en paralelo sobre un archivo ya reservado."""
+        # Dividir [0, size) en tramos iguales
+        step = -(-size // workers)
+        ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+        
+        lock = threading.Lock()
+        downloaded = 0
+        
+        def fetch_range(start: int, end: int):
+            nonlocal downloaded
+            headers = {'Range': f'bytes={start}-{end}'}
+            with self._session.get(url, headers=headers, stream=True, timeout=300) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise DownloadError('El servidor no respetó la petición por rangos')
+                
+                # Cada hilo usa su propio descriptor posicionado en su tramo
+                with io.FileIO(path, 'r+b') as f:
+                    f.seek(start)
+                    for chunk in response.raw.stream(CHUNK_SIZE, decode_content=True):
+                        self._write_all(f, chunk)
+                        with lock:
+                            downloaded += len(chunk)
+                            current = downloaded
+                        progress = int((current / size) * 80)  # 80% para descarga
+                        self._report_progress(progress, f'Descargando... {current // 1024} KB')
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(fetch_range, start, end) for start, end in ranges]
+            for future in futures:
+                future.result()
+        
+        if downloaded != size:
+            raise DownloadError(f'Descarga incompleta: {downloaded} de {size} bytes')
+    
+    @staticmethod
+    def _preallocate(f, size: int):
+        """Reserva espacio en disco para el archivo de una sola vez.
+        
+        Usa posix_fallocate donde existe (bloques contiguos sin extender el
+        archivo en cada escritura); en Windows fija el final con truncate.
+        """
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except (AttributeError, OSError):
+            f.truncate(size)
+    
+    @staticmethod
+    def _write_all(f: io.FileIO, data: bytes):
+        """Escribe todos los bytes en un archivo sin búfer (write puede ser parcial)."""
+        view = memoryview(data)
+        while view:
+            view = view[f.write(view):]
+    
+    @staticmethod
+    def _hash_file(file_path: Path, hasher=None):
+        """Añade el contenido de un archivo a un hash SHA-256 y lo devuelve."""
+        if hasher is None:
+            hasher = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher
+    
+    def _validate_checksum(self, file_path: Path, expected_checksum: str, digest: Optional[str] = None) -> bool:
+        """Valida el checksum SHA-256 de un archivo.
+        
+        Args:
+            file_path: Archivo a validar
+            expected_checksum: SHA-256 esperado en hexadecimal
+            digest: Hash ya calculado durante la descarga; si falta se lee el archivo
+        """
+        try:
+            actual_checksum = digest or self._hash_file(file_path).hexdigest()
             return actual_checksum.lower() == expected_checksum.lower()
             
         except Exception as e:
             self._log('ERROR', f'Error al validar checksum: {e}')
             return False
     
+    @staticmethod
+    def _is_zstd_bundle(name: str) -> bool:
+        """Indica si una URL o ruta corresponde a un paquete .tar.zst."""
+        return str(name).lower().endswith(ZSTD_BUNDLE_SUFFIX)
+    
+    def _validate_zstd_file(self, file_path: Path) -> bool:
+        """Valida que un archivo empiece por una trama zstd.
+        
+        El contenido se comprueba al descomprimirlo durante la instalación
+        (zstd verifica cada trama al leerla).
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                if f.read(4) != ZSTD_MAGIC:
+                    self._log('ERROR', 'Archivo no es un paquete zstd válido')
+                    return False
+            return True
+        except Exception as e:
+            self._log('ERROR', f'Error al validar paquete zstd: {e}')
+            return False
+    
     def _validate_zip_file(self, file_path: Path) -> bool:
         """Valida que un archivo sea un ZIP válido."""
         try:
+            # Abrir el ZIP solo lee el directorio central; el CRC de cada
+            # miembro se comprueba al extraerlo durante la instalación
             with zipfile.ZipFile(file_path, 'r') as zip_file:
-                # Verificar que el ZIP no esté corrupto
-                bad_file = zip_file.testzip()
-                if bad_file:
-                    self._log('ERROR', f'Archivo corrupto en ZIP: {bad_file}')
-                    return False
-                
                 # Verificar que contenga archivos esperados
                 file_list = zip_file.namelist()
                 if not file_list:
@@ -389,6 +747,18 @@ class Updater:
             backup_name = f"backup_v{self.current_version}_{timestamp}"
             backup_path = self.backup_dir / backup_name
             
+            # Los archivos se enlazan, así que no se puede reutilizar un respaldo
+            # creado en el mismo segundo
+            suffix = 1
+            while backup_path.exists():
+                backup_path = self.backup_dir / f"{backup_name}_{suffix}"
+                suffix += 1
+            
+            # Respaldo anterior, para reutilizar los archivos que no han cambiado
+            backups = self._list_backups()
+            previous_backup = backups[0] if backups else None
+            previous_manifest = self._load_manifest(previous_backup) if previous_backup else {}
+            
             # Crear directorio de respaldo
             backup_path.mkdir(exist_ok=True)
             
@@ -402,20 +772,45 @@ class Updater:
                 'requirements.txt'
             ]
             
-            total_items = len(items_to_backup)
-            for i, item in enumerate(items_to_backup):
+            # Reunir todos los archivos a copiar
+            backup_files = []
+            for item in items_to_backup:
                 item_path = self.app_dir / item
-                if item_path.exists():
-                    dest_path = backup_path / item
-                    
-                    if item_path.is_file():
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(item_path, dest_path)
-                    elif item_path.is_dir():
-                        shutil.copytree(item_path, dest_path, dirs_exist_ok=True)
+                if item_path.is_file():
+                    backup_files.append((item_path, backup_path / item))
+                elif item_path.is_dir():
+                    for src_path, rel_path in self._iter_files(item_path):
+                        backup_files.append((Path(src_path), backup_path / item / rel_path))
+            
+            # Manifiesto {ruta relativa: sha256} del contenido actual
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+                digests = executor.map(lambda job: self._hash_file(job[0]).hexdigest(), backup_files)
+                manifest = {dest_path.relative_to(backup_path).as_posix(): digest
+                            for (_, dest_path), digest in zip(backup_files, digests)}
+            
+            # Los archivos que la aplicación modifica en el sitio se copian; el
+            # resto se enlaza, ya que las actualizaciones los sustituyen con
+            # os.replace y nunca escriben sobre ellos
+            mutable_files = {self.app_dir / name for name in MUTABLE_FILES}
+            
+            def backup_file(src_path: Path, dest_path: Path):
+                # Sin cambios desde el respaldo anterior: enlazar su copia
+                rel_path = dest_path.relative_to(backup_path).as_posix()
+                if previous_manifest.get(rel_path) == manifest[rel_path]:
+                    try:
+                        os.link(previous_backup / rel_path, dest_path)
+                        return
+                    except OSError:
+                        pass
                 
-                progress = int(((i + 1) / total_items) * 100)
-                self._report_progress(progress, f'Respaldando {item}...')
+                if src_path in mutable_files:
+                    shutil.copy2(src_path, dest_path)
+                else:
+                    self._link_or_copy(src_path, dest_path)
+            
+            # Copiar en paralelo
+            self._copy_in_parallel(backup_files, backup_file, 0, 100, 'Respaldando archivos...')
+            self._save_manifest(backup_path, manifest)
             
             # Guardar información del respaldo
             backup_info = {
@@ -434,6 +829,50 @@ class Updater:
             self._log('ERROR', f'Error al crear respaldo: {e}')
             return False
     
+    @staticmethod
+    def _iter_files(root: Path) -> Iterator[Tuple[str, str]]:
+        """Recorre un directorio con os.scandir.
+        
+        Yields:
+            Pares (ruta, ruta relativa a root) de cada archivo
+        """
+        root = os.fspath(root)
+        base_len = len(root) + 1
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path, entry.path[base_len:]
+    
+    def _list_backups(self) -> List[Path]:
+        """Lista los respaldos existentes, del más reciente al más antiguo."""
+        if not self.backup_dir.exists():
+            return []
+        
+        backup_dirs = [d for d in self.backup_dir.iterdir() if d.is_dir() and d.name.startswith('backup_')]
+        
+        # Ordenar por fecha de creación (más reciente primero)
+        backup_dirs.sort(key=lambda x: x.stat().st_ctime, reverse=True)
+        return backup_dirs
+    
+    @staticmethod
+    def _load_manifest(backup_path: Path) -> Dict[str, str]:
+        """Carga el manifiesto de hashes de un respaldo (vacío si no tiene)."""
+        try:
+            with open(backup_path / 'manifest.json', 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _save_manifest(backup_path: Path, hashes: Dict[str, str]):
+        """Guarda el manifiesto {ruta relativa: sha256} de un respaldo."""
+        with open(backup_path / 'manifest.json', 'w', encoding='utf-8') as f:
+            json.dump(hashes, f, indent=2, ensure_ascii=False)
+    
     def install_update(self, update_path: Path, update_info: UpdateInfo) -> bool:
         """Instala una actualización.
         
@@ -460,26 +899,25 @@ class Updater:
                 if not self.create_backup():
                     raise InstallationError('Error al crear respaldo')
             
-            # Extraer actualización
-            self._report_progress(30, 'Extrayendo archivos...')
-            extract_path = self.temp_dir / f"extract_v{update_info.version}"
-            
-            if extract_path.exists():
-                shutil.rmtree(extract_path)
-            extract_path.mkdir()
-            
-            with zipfile.ZipFile(update_path, 'r') as zip_file:
-                zip_file.extractall(extract_path)
-            
-            # Validar estructura de actualización
-            self._report_progress(50, 'Validando actualización...')
-            if not self._validate_update_structure(extract_path):
-                raise InstallationError('Estructura de actualización inválida')
-            
-            # Aplicar actualización
-            self._report_progress(70, 'Aplicando actualización...')
-            if not self._apply_update(extract_path):
-                raise InstallationError('Error al aplicar actualización')
+            # Abrir actualización; los archivos se extraen directamente a su
+            # destino sin pasar por un directorio temporal
+            self._report_progress(30, 'Abriendo actualización...')
+            if self._is_zstd_bundle(update_path.name):
+                # Paquete .tar.zst: se lee en streaming y se valida al terminar
+                self._report_progress(70, 'Aplicando actualización...')
+                if not self._apply_zstd_update(update_path):
+                    raise InstallationError('Error al aplicar actualización')
+            else:
+                with zipfile.ZipFile(update_path, 'r') as zip_file:
+                    # Validar estructura de actualización
+                    self._report_progress(50, 'Validando actualización...')
+                    if not self._validate_update_structure(zip_file.namelist()):
+                        raise InstallationError('Estructura de actualización inválida')
+                    
+                    # Aplicar actualización
+                    self._report_progress(70, 'Aplicando actualización...')
+                    if not self._apply_update(zip_file):
+                        raise InstallationError('Error al aplicar actualización')
             
             # Actualizar información de versión
             self._report_progress(90, 'Finalizando...')
@@ -511,20 +949,27 @@ class Updater:
         finally:
             self.is_updating = False
     
-    def _validate_update_structure(self, extract_path: Path) -> bool:
-        """Valida la estructura de una actualización extraída."""
+    def _validate_update_structure(self, names: List[str]) -> bool:
+        """Valida la estructura de una actualización a partir de los nombres del ZIP."""
         try:
             # Verificar archivos esenciales
             required_files = ['main.py']
             required_dirs = ['core', 'gui', 'utils']
             
+            # Archivos y directorios de primer nivel presentes en el ZIP
+            top_files = set()
+            top_dirs = set()
+            for name in names:
+                head, sep, _ = name.replace('\\', '/').partition('/')
+                (top_dirs if sep else top_files).add(head)
+            
             for file_name in required_files:
-                if not (extract_path / file_name).exists():
+                if file_name not in top_files:
                     self._log('ERROR', f'Archivo requerido faltante: {file_name}')
                     return False
             
             for dir_name in required_dirs:
-                if not (extract_path / dir_name).is_dir():
+                if dir_name not in top_dirs:
                     self._log('ERROR', f'Directorio requerido faltante: {dir_name}')
                     return False
             
@@ -534,36 +979,158 @@ class Updater:
             self._log('ERROR', f'Error al validar estructura: {e}')
             return False
     
-    def _apply_update(self, extract_path: Path) -> bool:
-        """Aplica los archivos de actualización."""
+    def _member_destination(self, member_name: str) -> Optional[Path]:
+        """Obtiene la ruta de destino de un miembro del ZIP dentro de la aplicación.
+        
+        Returns:
+            Ruta de destino o None si el nombre saldría del directorio de la aplicación
+        """
+        parts = [part for part in member_name.replace('\\', '/').split('/') if part not in ('', '.')]
+        if not parts or '..' in parts or ':' in parts[0]:
+            return None
+        return self.app_dir.joinpath(*parts)
+    
+    def _apply_update(self, zip_file: zipfile.ZipFile) -> bool:
+        """Aplica los archivos de actualización extrayéndolos directamente desde el ZIP."""
         try:
             # Obtener lista de archivos a actualizar
             update_files = []
-            for root, dirs, files in os.walk(extract_path):
-                for file in files:
-                    src_path = Path(root) / file
-                    rel_path = src_path.relative_to(extract_path)
-                    update_files.append((src_path, self.app_dir / rel_path))
-            
-            # Aplicar archivos
-            total_files = len(update_files)
-            for i, (src_path, dest_path) in enumerate(update_files):
-                # Crear directorio padre si no existe
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Copiar archivo
-                shutil.copy2(src_path, dest_path)
-                
-                progress = int(((i + 1) / total_files) * 100)
-                if progress % 10 == 0:  # Reportar cada 10%
-                    self._report_progress(70 + (progress // 5), f'Copiando archivos... {i+1}/{total_files}')
+            for info in zip_file.infolist():
+                if info.is_dir():
+                    continue
+                dest_path = self._member_destination(info.filename)
+                if dest_path is None:
+                    self._log('WARNING', f'Ruta no permitida en la actualización: {info.filename}')
+                    continue
+                update_files.append((info, dest_path))
+            
+            # Fase 1: extraer cada archivo a un temporal junto a su destino.
+            # Los archivos instalados (enlazados desde el respaldo) no se tocan
+            staged = [(info, dest_path, dest_path.with_name(f'.{dest_path.name}.new'))
+                      for info, dest_path in update_files]
+            
+            def extract_member(info: zipfile.ZipInfo, tmp_path: Path):
+                with open(tmp_path, 'wb') as dst:
+                    self._extract_member(zip_file, info, dst)
+            
+            try:
+                self._copy_in_parallel([(info, tmp_path) for info, _, tmp_path in staged],
+                                       extract_member, 70, 20, 'Copiando archivos...')
+            except BaseException:
+                # Nada se ha sustituido todavía: basta con borrar los temporales
+                for _, _, tmp_path in staged:
+                    tmp_path.unlink(missing_ok=True)
+                raise
+            
+            # Fase 2: sustituir con os.replace (un rename por archivo, sin copiar bytes)
+            for _, dest_path, tmp_path in staged:
+                os.replace(tmp_path, dest_path)
+            
+            return True
+            
+        except Exception as e:
+            self._log('ERROR', f'Error al aplicar actualización: {e}')
+            return False
+    
+    def _apply_zstd_update(self, update_path: Path) -> bool:
+        """Aplica un paquete .tar.zst leyéndolo en streaming.
+        
+        Sin acceso aleatorio no se puede validar la estructura antes de leer:
+        los archivos se preparan como temporales .new, se valida la lista de
+        nombres al terminar y solo entonces se sustituyen con os.replace.
+        """
+        staged = []
+        try:
+            if zstandard is None:
+                self._log('ERROR', 'Se necesita el paquete zstandard para instalar esta actualización')
+                return False
+            
+            names = []
+            decompressor = zstandard.ZstdDecompressor()
+            with open(update_path, 'rb') as raw, decompressor.stream_reader(raw) as reader, \
+                    tarfile.open(fileobj=reader, mode='r|') as tar:
+                for member in tar:
+                    names.append(member.name + '/' if member.isdir() else member.name)
+                    if not member.isfile():
+                        continue
+                    dest_path = self._member_destination(member.name)
+                    if dest_path is None:
+                        self._log('WARNING', f'Ruta no permitida en la actualización: {member.name}')
+                        continue
+                    
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = dest_path.with_name(f'.{dest_path.name}.new')
+                    staged.append((dest_path, tmp_path))
+                    with tar.extractfile(member) as src, open(tmp_path, 'wb') as dst:
+                        shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            
+            if not self._validate_update_structure(names):
+                for _, tmp_path in staged:
+                    tmp_path.unlink(missing_ok=True)
+                return False
+            
+            # Sustituir con os.replace (un rename por archivo, sin copiar bytes)
+            for dest_path, tmp_path in staged:
+                os.replace(tmp_path, dest_path)
             
             return True
             
         except Exception as e:
+            for _, tmp_path in staged:
+                tmp_path.unlink(missing_ok=True)
             self._log('ERROR', f'Error al aplicar actualización: {e}')
             return False
     
+    @staticmethod
+    def _extract_member(zip_file: zipfile.ZipFile, info: zipfile.ZipInfo, dst):
+        """Escribe en dst el contenido descomprimido de un miembro del ZIP.
+        
+        zip_file.open verifica el CRC al leer (BadZipFile si no coincide).
+        """
+        with zip_file.open(info) as src:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+    
+    @staticmethod
+    def _link_or_copy(src_path: Path, dest_path: Path):
+        """Crea un enlace duro al archivo o lo copia si el sistema no lo permite."""
+        try:
+            os.link(src_path, dest_path)
+        except OSError:
+            # Otro volumen, sistema de archivos sin enlaces o sin permisos
+            shutil.copy2(src_path, dest_path)
+    
+    @staticmethod
+    def _make_parent_dirs(paths: Iterable[Path]):
+        """Crea los directorios padre de un conjunto de rutas, cada uno una sola vez."""
+        # De menor a mayor profundidad: cada mkdir encuentra ya creado su padre
+        for parent in sorted({path.parent for path in paths}, key=lambda p: len(p.parts)):
+            parent.mkdir(parents=True, exist_ok=True)
+    
+    def _copy_in_parallel(self, jobs: List[Tuple[Any, Path]], copy_func: Callable[[Any, Path], Any],
+                          base_progress: int, progress_span: int, message: str):
+        """Ejecuta copias de archivos en varios hilos.
+        
+        Args:
+            jobs: Pares (origen, destino)
+            copy_func: Función que copia un origen en su destino
+            base_progress: Porcentaje desde el que se reporta el progreso
+            progress_span: Rango de porcentaje que ocupan las copias
+            message: Mensaje de progreso
+        """
+        # Crear los directorios de destino una sola vez, antes de copiar
+        self._make_parent_dirs(dest_path for _, dest_path in jobs)
+        
+        total_files = len(jobs)
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            futures = [executor.submit(copy_func, src, dest_path) for src, dest_path in jobs]
+            for i, future in enumerate(as_completed(futures), 1):
+                future.result()
+                
+                progress = int((i / total_files) * 100)
+                if progress % 10 == 0:  # Reportar cada 10%
+                    self._report_progress(base_progress + progress * progress_span // 100,
+                                          f'{message} {i}/{total_files}')
+    
     def _attempt_rollback(self) -> bool:
         """Intenta hacer rollback a la versión anterior."""
         try:
@@ -572,25 +1139,33 @@ class Updater:
                 self._log('ERROR', 'No hay directorio de respaldos')
                 return False
             
-            backup_dirs = [d for d in self.backup_dir.iterdir() if d.is_dir() and d.name.startswith('backup_')]
+            backup_dirs = self._list_backups()
             if not backup_dirs:
                 self._log('ERROR', 'No hay respaldos disponibles')
                 return False
             
-            # Ordenar por fecha de creación (más reciente primero)
-            backup_dirs.sort(key=lambda x: x.stat().st_ctime, reverse=True)
             latest_backup = backup_dirs[0]
             
             self._log('INFO', f'Restaurando desde respaldo: {latest_backup}')
             
-            # Restaurar archivos
+            manifest = self._load_manifest(latest_backup)
+            if manifest:
+                self._restore_from_manifest(latest_backup, manifest)
+                self._cleanup_temp_files()
+                self._log('INFO', 'Rollback completado')
+                return True
+            
+            # Respaldo sin manifiesto (versiones anteriores): restaurar copiando
             for item in latest_backup.iterdir():
-                if item.name == 'backup_info.json':
+                if item.name in ('backup_info.json', 'manifest.json'):
                     continue
                 
                 dest_path = self.app_dir / item.name
                 
                 if item.is_file():
+                    # Un archivo que la actualización no tocó sigue enlazado al respaldo
+                    if dest_path.exists() and os.path.samefile(item, dest_path):
+                        continue
                     shutil.copy2(item, dest_path)
                 elif item.is_dir():
                     if dest_path.exists():
@@ -604,6 +1179,40 @@ class Updater:
             self._log('ERROR', f'Error durante rollback: {e}')
             return False
     
+    def _restore_from_manifest(self, backup_path: Path, manifest: Dict[str, str]):
+        """Restaura los archivos listados en el manifiesto de un respaldo.
+        
+        Cada archivo se enlaza desde el respaldo a un temporal y se sustituye con
+        os.replace; los que siguen enlazados al respaldo no se tocan.
+        """
+        # Quitar los archivos que la actualización añadió en los directorios respaldados
+        top_dirs = {rel_path.split('/', 1)[0] for rel_path in manifest if '/' in rel_path}
+        for top_dir in top_dirs:
+            dir_path = self.app_dir / top_dir
+            if dir_path.is_dir():
+                for file_path, rel_path in list(self._iter_files(dir_path)):
+                    if f"{top_dir}/{rel_path.replace(os.sep, '/')}" not in manifest:
+                        os.remove(file_path)
+        
+        # Un archivo que la actualización no tocó sigue enlazado al respaldo
+        to_restore = []
+        for rel_path in manifest:
+            src_path = backup_path / rel_path
+            dest_path = self.app_dir / rel_path
+            if not (dest_path.exists() and os.path.samefile(src_path, dest_path)):
+                to_restore.append((rel_path, src_path, dest_path))
+        
+        self._make_parent_dirs(dest_path for _, _, dest_path in to_restore)
+        
+        for rel_path, src_path, dest_path in to_restore:
+            tmp_path = dest_path.with_name(f'.{dest_path.name}.new')
+            tmp_path.unlink(missing_ok=True)
+            if rel_path in MUTABLE_FILES:
+                shutil.copy2(src_path, tmp_path)
+            else:
+                self._link_or_copy(src_path, tmp_path)
+            os.replace(tmp_path, dest_path)
+    
     def _cleanup_temp_files(self):
         """Limpia archivos temporales de actualización."""
         try:
@@ -620,23 +1229,68 @@ class Updater:
     def get_update_history(self) -> list:
         """Obtiene el historial de actualizaciones."""
         try:
-            if self.version_file.exists():
-                with open(self.version_file, 'r', encoding='utf-8') as f:
-                    version_data = json.load(f)
-                    return version_data.get('update_history', [])
-            return []
+            # Servido desde memoria, sin acceder al disco
+            return self._version_data.get('update_history', [])
             
         except Exception as e:
             self._log('ERROR', f'Error al obtener historial: {e}')
             return []
     
+    def _record_release(self, published_at: str):
+        """Añade la fecha de publicación de un release al historial."""
+        history = self._state.get('release_history', [])
+        if published_at and published_at not in history:
+            history = sorted(history + [published_at])[-RELEASE_HISTORY_SIZE:]
+            self._update_state({'release_history': history})
+    
+    def _check_interval(self) -> timedelta:
+        """Calcula el intervalo entre verificaciones.
+        
+        Parte de check_frequency_hours; si hay historial de releases se acorta a
+        un cuarto de la mediana entre publicaciones, y tras errores de red se
+        duplica por cada fallo consecutivo (hasta MAX_CHECK_BACKOFF).
+        """
+        interval = timedelta(hours=self.config.check_frequency_hours)
+        
+        history = self._state.get('release_history', [])
+        if len(history) >= 2:
+            try:
+                dates = [datetime.fromisoformat(date.replace('Z', '+00:00')) for date in history]
+                gaps = sorted(later - earlier for earlier, later in zip(dates, dates[1:]))
+                median_gap = gaps[len(gaps) // 2]
+                if median_gap > timedelta(0):
+                    interval = min(interval, median_gap / 4)
+            except ValueError:
+                pass
+        
+        if self._failed_checks:
+            interval = min(interval * (2 ** min(self._failed_checks, 16)), max(interval, MAX_CHECK_BACKOFF))
+        
+        return interval
+    
     def should_check_for_updates(self) -> bool:
         """Determina si es momento de verificar actualizaciones."""
         if not self.last_check:
             return True
         
         time_since_check = datetime.now() - self.last_check
-        return time_since_check >= timedelta(hours=self.config.check_frequency_hours)
+        return time_since_check >= self._check_interval()
+    
+    def is_server_reachable(self, timeout: float = REACHABILITY_TIMEOUT) -> bool:
+        """Comprueba con una conexión TCP rápida si hay acceso al servidor.
+        
+        Permite omitir la verificación sin esperar al timeout de la petición
+        HTTP cuando el equipo no tiene red.
+        """
+        parsed = urlparse(self.config.update_server_url)
+        if not parsed.hostname:
+            return False
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        try:
+            with socket.create_connection((parsed.hostname, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
     
     def get_status(self) -> Dict[str, Any]:
         """Obtiene el estado actual del sistema de actualizaciones."""
@@ -644,7 +1298,7 @@ class Updater:
             'current_version': self.current_version,
             'is_updating': self.is_updating,
             'last_check': self.last_check.isoformat() if self.last_check else None,
-            'next_check': (self.last_check + timedelta(hours=self.config.check_frequency_hours)).isoformat() if self.last_check else None,
+            'next_check': (self.last_check + self._check_interval()).isoformat() if self.last_check else None,
             'config': {
                 'auto_download': self.config.auto_download,
                 'auto_install': self.config.auto_install,
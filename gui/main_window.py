@@ -8,10 +8,15 @@ incluyendo todas las pestañas, controles y funcionalidades de usuario.
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, filedialog, messagebox, simpledialog
 import threading
+import webbrowser
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
 import os
 
 # Importar módulos del core
@@ -20,8 +25,8 @@ from core.logger import CustomLogger
 from core.compressor import CompressorEngine, CompressionConfig
 from core.file_manager import FileManager
 from core.updater import Updater, UpdateConfig, UpdateInfo
-from utils.validators import validate_compression_config, PathValidator
-from utils.helpers import FileUtils, TimeUtils, create_progress_bar
+from utils.validators import validate_compression_config, PathValidator, InputValidator
+from utils.helpers import FileUtils, TimeUtils, create_progress_bar, get_system_info
 from gui.update_dialog import UpdateNotificationDialog, UpdateProgressDialog, UpdateSettingsDialog
 from gui.rename_tab import RenameTab
 
@@ -29,6 +34,37 @@ from gui.rename_tab import RenameTab
 class MainWindow:
     """Ventana principal de la aplicación."""
     
+    # Intervalo entre volcados del log al widget
+    LOG_PUMP_INTERVAL_MS = 50
+    # Máximo de líneas conservadas en el widget de log (por defecto y mínimo);
+    # se puede ajustar con app_settings.max_log_lines
+    LOG_MAX_LINES = 5000
+    LOG_MIN_LINES = 500
+    # Líneas del log copiadas por bloque al exportar
+    LOG_EXPORT_CHUNK_LINES = 1000
+    # Intervalo de refresco de la barra de progreso (~60 Hz) y de las
+    # estadísticas de sesión durante el proceso
+    PROGRESS_PUMP_INTERVAL_MS = 16
+    STATS_REFRESH_INTERVAL_MS = 500
+    # Vigencia de las estadísticas de sesión consultadas al logger
+    SESSION_STATS_TTL = 0.5
+    # Espera tras el último movimiento del nivel de compresión
+    SCALE_DEBOUNCE_MS = 50
+    # Retraso de las tareas de arranque tras crear la ventana
+    STARTUP_TASKS_DELAY_MS = 200
+    
+    # Refresco de CPU/RAM en la barra de estado: visible, minimizada y
+    # tras iniciar la medición de CPU
+    SYSTEM_INFO_INTERVAL_MS = 5000
+    SYSTEM_INFO_HIDDEN_MS = 30000
+    SYSTEM_INFO_PRIME_MS = 1000
+    
+    DEFAULT_FILE_FILTERS = ['*']
+    
+    SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+    
+    COMPRESSION_LABELS = {0: "0 (Sin compresión)", 1: "1 (Rápido)", 6: "6 (Normal)", 9: "9 (Máximo)"}
+    
     def __init__(self):
         """Inicializa la ventana principal."""
         # Inicializar componentes del core
@@ -37,9 +73,12 @@ class MainWindow:
         self.compressor = CompressorEngine(self.config_manager, self.logger)
         self.file_manager = FileManager(self.logger)
         
-        # Inicializar sistema de actualizaciones
+        # Inicializar sistema de actualizaciones; las versiones omitidas se
+        # guardan en memoria y se escriben una sola vez al cerrar
         self.updater = None
         self.update_config = None
+        self._dismissed_versions: Set[str] = set()
+        self._dismissed_dirty = False
         self._init_updater()
         
         # Variables de estado
@@ -47,6 +86,81 @@ class MainWindow:
         self.is_processing = False
         self.processing_thread: Optional[threading.Thread] = None
         
+        # Pool para tareas de fondo (escaneo de carpetas, información del
+        # sistema); el token descarta resultados de escaneos ya superados por
+        # una selección más reciente
+        self._scan_pool = ThreadPoolExecutor(max_workers=2)
+        self._scan_token = 0
+        
+        # Límite de líneas del widget de log según la configuración
+        try:
+            max_lines = int(self.config_manager.get_app_setting('max_log_lines', self.LOG_MAX_LINES))
+        except (TypeError, ValueError):
+            max_lines = self.LOG_MAX_LINES
+        self._log_max_lines = max(max_lines, self.LOG_MIN_LINES)
+        
+        # Cola acotada de registros de log; el logger la alimenta desde sus
+        # hilos y la UI la vacía por lotes en _pump_log. Si se desborda se
+        # descartan los más antiguos, que el recorte del widget borraría igual
+        self._log_queue: deque = deque(maxlen=self._log_max_lines)
+        
+        # Última marca de tiempo formateada para el log (segundo, texto)
+        self._last_ts_int = 0
+        self._last_ts_str = ''
+        self._log_line_count = 0
+        
+        # Pestañas cuyo contenido se construye al seleccionarlas por primera vez
+        self._tab_built = {'config': False, 'profiles': False}
+        
+        # Opciones de configuración que muestran las pestañas (patrones,
+        # filtros y conflictos), leídas una vez y renovadas al cargar perfil
+        self._config_snapshot: Dict[str, Dict[str, Any]] = {}
+        self._refresh_config_snapshot()
+        
+        # Fecha usada por la vista previa
+        self._today_ordinal = 0
+        self._today_str = ''
+        
+        # Perfiles en memoria; se renuevan tras guardar, eliminar o importar.
+        # La generación permite saber si el árbol ya refleja la caché actual
+        self._profile_cache: Dict[str, Dict[str, Any]] = {}
+        self._profile_generation = 0
+        self._profile_rows_generation = -1
+        self._reload_profile_cache()
+        
+        # Valores mostrados por fila en el árbol de perfiles (iid = nombre)
+        self._profile_rows: Dict[str, tuple] = {}
+        self._profile_row_stamps: Dict[str, Optional[str]] = {}
+        
+        # Último progreso notificado por el compresor y último mostrado;
+        # el hilo de compresión solo reemplaza la tupla, la UI la lee
+        self._progress_state: Optional[tuple] = None
+        self._progress_rendered: Optional[tuple] = None
+        self._progress_pump_id: Optional[str] = None
+        
+        # Estadísticas de sesión pendientes de mostrar y últimas mostradas
+        self._stats_state: Optional[Dict[str, Any]] = None
+        self._stats_rendered: Optional[Dict[str, Any]] = None
+        self._stats_idle: Optional[str] = None
+        self._cached_stats: Optional[Dict[str, Any]] = None
+        # Texto mostrado en cada etiqueta de estadísticas
+        self._last_stats_texts: Dict[Any, str] = {}
+        self._stats_expiry = 0.0
+        
+        # Estado de la lectura de CPU/RAM de la barra de estado
+        self._system_info_available = True
+        self._cpu_primed = False
+        self._psutil = None
+        
+        # Hay cambios del perfil sin guardar
+        self._profile_dirty = False
+        
+        # Extracto del manual ya leído (se carga al primer uso)
+        self._manual_cache: Optional[str] = None
+        
+        # Actualización pendiente de la etiqueta de compresión
+        self._scale_after: Optional[str] = None
+        
         # Configurar callbacks
         self.compressor.set_progress_callback(self.update_progress)
         self.compressor.set_file_callback(self.update_file_status)
@@ -56,8 +170,8 @@ class MainWindow:
         self.setup_ui()
         self.load_current_profile()
         
-        # Verificar actualizaciones al inicio (en hilo separado)
-        self._check_updates_on_startup()
+        # Tareas de arranque diferidas hasta que la ventana esté visible
+        self.root.after(self.STARTUP_TASKS_DELAY_MS, self._check_updates_on_startup)
     
     def setup_ui(self):
         """Configura la interfaz de usuario."""
@@ -87,8 +201,34 @@ class MainWindow:
         # Barra de estado
         self.create_status_bar()
         
+        # Variables que componen la configuración actual, en orden de salida
+        self._config_vars = (
+            ('source_folder', self.source_var),
+            ('backup_folder', self.backup_var),
+            ('naming_pattern', self.naming_pattern_var),
+            ('custom_pattern', self.custom_pattern_var),
+            ('include_subfolders', self.include_subfolders_var),
+            ('file_filters', None),
+            ('compression_level', self.compression_level_var),
+            ('conflict_resolution', self.conflict_resolution_var),
+            ('verify_integrity', self.verify_integrity_var)
+        )
+        
+        # Marcar el perfil como modificado cuando cambie cualquiera de sus valores
+        profile_vars = [var for key, var in self._config_vars
+                        if var is not None and key != 'source_folder']
+        profile_vars += [self.file_filter_var, self.custom_filters_var]
+        for var in profile_vars:
+            var.trace_add('write', self._mark_profile_dirty)
+        
         # Configurar eventos
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        
+        # Iniciar el volcado periódico del log (el del progreso arranca con
+        # cada compresión)
+        self._pump_log()
+        self._stats_tick()
     
     def setup_styles(self):
         """Configura los estilos de la interfaz."""
@@ -184,12 +324,7 @@ class MainWindow:
         self.compression_label.grid(row=0, column=3, padx=5, pady=2)
         
         # Actualizar etiqueta de compresión
-        def update_compression_label(event=None):
-            level = int(self.compression_level_var.get())
-            labels = {0: "0 (Sin compresión)", 1: "1 (Rápido)", 6: "6 (Normal)", 9: "9 (Máximo)"}
-            self.compression_label.config(text=labels.get(level, f"{level}"))
-        
-        compression_scale.config(command=update_compression_label)
+        compression_scale.config(command=self.update_compression_label)
         
         options_frame.columnconfigure(2, weight=1)
         
@@ -214,7 +349,8 @@ class MainWindow:
         info_frame = ttk.LabelFrame(main_frame, text="Información", padding=10)
         info_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        self.info_text = tk.Text(info_frame, height=8, wrap=tk.WORD, state=tk.DISABLED)
+        self.info_text = tk.Text(info_frame, height=8, wrap=tk.WORD)
+        self._make_readonly(self.info_text)
         info_scrollbar = ttk.Scrollbar(info_frame, orient=tk.VERTICAL, command=self.info_text.yview)
         self.info_text.config(yscrollcommand=info_scrollbar.set)
         
@@ -222,9 +358,25 @@ class MainWindow:
         info_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
     def create_config_tab(self):
-        """Crea la pestaña de configuración."""
-        config_frame = ttk.Frame(self.notebook)
-        self.notebook.add(config_frame, text="Configuración")
+        """Crea la pestaña de configuración.
+        
+        Las variables se crean de inmediato porque los perfiles las usan;
+        los widgets se construyen en _build_config_tab al abrir la pestaña.
+        """
+        self.config_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.config_frame, text="Configuración")
+        
+        self.naming_pattern_var = tk.StringVar(value="fecha_archivo")
+        self.custom_pattern_var = tk.StringVar()
+        self.file_filter_var = tk.StringVar(value="todos")
+        self.custom_filters_var = tk.StringVar(value="*.pdf, *.jpg, *.docx")
+        self.conflict_resolution_var = tk.StringVar(value="rename")
+        self.verify_integrity_var = tk.BooleanVar(value=True)
+        self.auto_backup_var = tk.BooleanVar(value=True)
+    
+    def _build_config_tab(self):
+        """Construye los widgets de la pestaña de configuración."""
+        config_frame = self.config_frame
         
         # Frame para patrones de nomenclatura
         naming_frame = ttk.LabelFrame(config_frame, text="Nomenclatura de Archivos", padding=10)
@@ -232,16 +384,13 @@ class MainWindow:
         
         ttk.Label(naming_frame, text="Patrón de nomenclatura:").grid(row=0, column=0, sticky=tk.W, pady=2)
         
-        self.naming_pattern_var = tk.StringVar(value="fecha_archivo")
-        patterns = list(self.config_manager.get_naming_patterns().keys())
-        pattern_combo = ttk.Combobox(naming_frame, textvariable=self.naming_pattern_var, 
-                                   values=patterns, state="readonly")
-        pattern_combo.grid(row=0, column=1, padx=5, pady=2, sticky=tk.EW)
-        pattern_combo.bind('<<ComboboxSelected>>', self.on_pattern_change)
+        self.pattern_combo = ttk.Combobox(naming_frame, textvariable=self.naming_pattern_var, 
+                                        values=list(self._config_snapshot['naming']), state="readonly")
+        self.pattern_combo.grid(row=0, column=1, padx=5, pady=2, sticky=tk.EW)
+        self.pattern_combo.bind('<<ComboboxSelected>>', self.on_pattern_change)
         
         # Patrón personalizado
         ttk.Label(naming_frame, text="Patrón personalizado:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.custom_pattern_var = tk.StringVar()
         self.custom_pattern_entry = ttk.Entry(naming_frame, textvariable=self.custom_pattern_var, 
                                             state=tk.DISABLED)
         self.custom_pattern_entry.grid(row=1, column=1, padx=5, pady=2, sticky=tk.EW)
@@ -260,15 +409,12 @@ class MainWindow:
         
         ttk.Label(filters_frame, text="Tipos de archivo:").grid(row=0, column=0, sticky=tk.W, pady=2)
         
-        self.file_filter_var = tk.StringVar(value="todos")
-        filter_presets = self.config_manager.config_data.get('file_filters_presets', {})
-        filter_combo = ttk.Combobox(filters_frame, textvariable=self.file_filter_var,
-                                  values=list(filter_presets.keys()), state="readonly")
-        filter_combo.grid(row=0, column=1, padx=5, pady=2, sticky=tk.EW)
+        self.filter_combo = ttk.Combobox(filters_frame, textvariable=self.file_filter_var,
+                                       values=list(self._config_snapshot['filters']), state="readonly")
+        self.filter_combo.grid(row=0, column=1, padx=5, pady=2, sticky=tk.EW)
         
         # Filtros personalizados
         ttk.Label(filters_frame, text="Filtros personalizados:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.custom_filters_var = tk.StringVar(value="*.pdf, *.jpg, *.docx")
         ttk.Entry(filters_frame, textvariable=self.custom_filters_var).grid(row=1, column=1, padx=5, pady=2, sticky=tk.EW)
         
         filters_frame.columnconfigure(1, weight=1)
@@ -279,10 +425,9 @@ class MainWindow:
         
         ttk.Label(conflicts_frame, text="Cuando el archivo ZIP ya existe:").grid(row=0, column=0, sticky=tk.W, pady=2)
         
-        self.conflict_resolution_var = tk.StringVar(value="rename")
-        resolutions = list(self.config_manager.get_conflict_resolutions().keys())
-        ttk.Combobox(conflicts_frame, textvariable=self.conflict_resolution_var,
-                    values=resolutions, state="readonly").grid(row=0, column=1, padx=5, pady=2, sticky=tk.EW)
+        self.conflict_combo = ttk.Combobox(conflicts_frame, textvariable=self.conflict_resolution_var,
+                                         values=list(self._config_snapshot['conflicts']), state="readonly")
+        self.conflict_combo.grid(row=0, column=1, padx=5, pady=2, sticky=tk.EW)
         
         conflicts_frame.columnconfigure(1, weight=1)
         
@@ -290,13 +435,14 @@ class MainWindow:
         advanced_frame = ttk.LabelFrame(config_frame, text="Opciones Avanzadas", padding=10)
         advanced_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.verify_integrity_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(advanced_frame, text="Verificar integridad de archivos ZIP",
                        variable=self.verify_integrity_var).pack(anchor=tk.W, pady=2)
         
-        self.auto_backup_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(advanced_frame, text="Mover archivos originales a respaldo automáticamente",
                        variable=self.auto_backup_var).pack(anchor=tk.W, pady=2)
+        
+        self._tab_built['config'] = True
+        self.on_pattern_change()
     
     def create_progress_tab(self):
         """Crea la pestaña de progreso y logging."""
@@ -370,8 +516,9 @@ class MainWindow:
         log_text_frame = ttk.Frame(log_frame)
         log_text_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.log_text = tk.Text(log_text_frame, height=15, wrap=tk.WORD, state=tk.DISABLED,
+        self.log_text = tk.Text(log_text_frame, height=15, wrap=tk.WORD,
                                font=('Consolas', 9))
+        self._make_readonly(self.log_text)
         log_scrollbar = ttk.Scrollbar(log_text_frame, orient=tk.VERTICAL, command=self.log_text.yview)
         self.log_text.config(yscrollcommand=log_scrollbar.set)
         
@@ -394,9 +541,19 @@ class MainWindow:
                   command=self.export_log).pack(side=tk.LEFT, padx=5)
     
     def create_profiles_tab(self):
-        """Crea la pestaña de gestión de perfiles."""
-        profiles_frame = ttk.Frame(self.notebook)
-        self.notebook.add(profiles_frame, text="Perfiles")
+        """Crea la pestaña de gestión de perfiles.
+        
+        Los widgets y la lista de perfiles se construyen en
+        _build_profiles_tab al abrir la pestaña.
+        """
+        self.profiles_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.profiles_frame, text="Perfiles")
+        
+        self.current_profile_var = tk.StringVar(value=self.current_profile)
+    
+    def _build_profiles_tab(self):
+        """Construye los widgets de la pestaña de perfiles."""
+        profiles_frame = self.profiles_frame
         
         # Frame para selección de perfil
         selection_frame = ttk.LabelFrame(profiles_frame, text="Perfil Actual", padding=10)
@@ -404,7 +561,6 @@ class MainWindow:
         
         ttk.Label(selection_frame, text="Perfil activo:").grid(row=0, column=0, sticky=tk.W, pady=2)
         
-        self.current_profile_var = tk.StringVar(value=self.current_profile)
         self.profile_combo = ttk.Combobox(selection_frame, textvariable=self.current_profile_var,
                                         state="readonly")
         self.profile_combo.grid(row=0, column=1, padx=5, pady=2, sticky=tk.EW)
@@ -452,9 +608,38 @@ class MainWindow:
         self.profiles_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         profiles_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        self._tab_built['profiles'] = True
+        
         # Actualizar lista de perfiles
+        self.update_profiles_combo()
         self.update_profiles_list()
     
+    def _on_tab_changed(self, event=None):
+        """Construye el contenido de una pestaña diferida la primera vez que se abre."""
+        selected = self.notebook.select()
+        if selected == str(self.config_frame) and not self._tab_built['config']:
+            self._build_config_tab()
+        elif selected == str(self.profiles_frame) and not self._tab_built['profiles']:
+            self._build_profiles_tab()
+    
+    @staticmethod
+    def _make_readonly(text_widget: tk.Text):
+        """Impide editar un Text desde el teclado sin deshabilitarlo.
+        
+        El widget permanece en estado NORMAL, así que el programa puede
+        actualizarlo sin alternar su estado; se permiten copiar y seleccionar.
+        """
+        def block_key(event):
+            if event.state & 0x4 and event.keysym.lower() in ('c', 'a'):
+                return None
+            if event.keysym in ('Left', 'Right', 'Up', 'Down', 'Home', 'End', 'Prior', 'Next'):
+                return None
+            return 'break'
+        
+        text_widget.bind('<Key>', block_key)
+        for sequence in ('<<Paste>>', '<<PasteSelection>>', '<<Cut>>', '<<Clear>>'):
+            text_widget.bind(sequence, lambda e: 'break')
+    
     def create_status_bar(self):
         """Crea la barra de estado."""
         self.status_bar = ttk.Frame(self.root)
@@ -467,15 +652,33 @@ class MainWindow:
         self.system_label = ttk.Label(self.status_bar, text="")
         self.system_label.pack(side=tk.RIGHT, padx=5, pady=2)
         
-        self.update_system_info()
+        self.root.after(self.STARTUP_TASKS_DELAY_MS, self.update_system_info)
     
     # Métodos de eventos y callbacks
+    def update_compression_label(self, event=None):
+        """Programa la actualización de la etiqueta de compresión.
+        
+        Mientras se arrastra el control solo se aplica el último valor.
+        """
+        if self._scale_after is not None:
+            self.root.after_cancel(self._scale_after)
+        self._scale_after = self.root.after(self.SCALE_DEBOUNCE_MS, self._apply_compression_label)
+    
+    def _apply_compression_label(self):
+        """Muestra el nivel de compresión seleccionado."""
+        self._scale_after = None
+        level = int(self.compression_level_var.get())
+        self.compression_label.config(text=self.COMPRESSION_LABELS.get(level, f"{level}"))
+    
     def browse_source_folder(self):
         """Abre diálogo para seleccionar carpeta origen."""
         folder = filedialog.askdirectory(title="Seleccionar carpeta origen")
         if folder:
             self.source_var.set(folder)
-            self.update_file_info()
+            # Devolver el control al bucle de eventos antes de lanzar el escaneo
+            # para que el cierre del diálogo y el aviso se pinten de inmediato
+            self.update_info_display("Analizando carpeta...")
+            self.root.after(0, self.update_file_info)
     
     def browse_backup_folder(self):
         """Abre diálogo para seleccionar carpeta de respaldo."""
@@ -485,6 +688,9 @@ class MainWindow:
     
     def on_pattern_change(self, event=None):
         """Maneja el cambio de patrón de nomenclatura."""
+        if not self._tab_built['config']:
+            return
+        
         pattern = self.naming_pattern_var.get()
         if pattern == 'personalizado':
             self.custom_pattern_entry.config(state=tk.NORMAL)
@@ -493,16 +699,26 @@ class MainWindow:
         
         self.update_preview()
     
+    def _today(self) -> str:
+        """Devuelve la fecha actual formateada, recalculándola solo al cambiar de día."""
+        ordinal = date.today().toordinal()
+        if ordinal != self._today_ordinal:
+            self._today_ordinal = ordinal
+            self._today_str = datetime.now().strftime('%Y-%m-%d')
+        return self._today_str
+    
     def update_preview(self):
         """Actualiza la vista previa del nombre de archivo."""
+        if not self._tab_built['config']:
+            return
+        
         pattern = self.naming_pattern_var.get()
         if pattern == 'personalizado':
             custom = self.custom_pattern_var.get()
             if custom:
                 try:
-                    from datetime import datetime
                     preview = custom.format(
-                        fecha=datetime.now().strftime('%Y-%m-%d'),
+                        fecha=self._today(),
                         nombre_original='documento',
                         contador=1
                     ) + '.zip'
@@ -512,12 +728,11 @@ class MainWindow:
             else:
                 self.preview_label.config(text='Especifique patrón personalizado')
         else:
-            patterns = self.config_manager.get_naming_patterns()
+            patterns = self._config_snapshot['naming']
             if pattern in patterns:
                 try:
-                    from datetime import datetime
                     preview = patterns[pattern].format(
-                        fecha=datetime.now().strftime('%Y-%m-%d'),
+                        fecha=self._today(),
                         nombre_original='documento',
                         contador=1
                     ) + '.zip'
@@ -529,49 +744,68 @@ class MainWindow:
         """Actualiza la información de archivos en la carpeta seleccionada."""
         source_folder = self.source_var.get()
         if not source_folder or not Path(source_folder).exists():
+            self._scan_token += 1
             self.update_info_display("Seleccione una carpeta válida")
             return
         
+        # Capturar el estado de Tk en el hilo principal antes de delegar
+        include_subfolders = self.include_subfolders_var.get()
+        self._scan_token += 1
+        token = self._scan_token
+        
+        self.update_info_display("Analizando carpeta...")
+        future = self._scan_pool.submit(self._scan_worker, Path(source_folder), include_subfolders)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_scan_done, token, f.result())
+        )
+    
+    def _scan_worker(self, folder: Path, include_subfolders: bool) -> str:
+        """Escanea la carpeta en un hilo del pool y devuelve el texto a mostrar."""
         try:
-            # Escanear archivos
-            files = self.file_manager.scan_directory(
-                Path(source_folder),
-                self.include_subfolders_var.get(),
+            # Escanear archivos y calcular estadísticas en una sola pasada
+            stats = self.file_manager.scan_and_stat(
+                folder,
+                include_subfolders,
                 ['*']  # Todos los archivos por ahora
             )
             
-            # Calcular estadísticas
-            stats = self.file_manager.get_file_statistics(files)
-            
-            info_text = f"""Información de la carpeta seleccionada:
-
-Total de archivos: {stats['total_files']}
-Tamaño total: {FileUtils.format_file_size(stats['total_size'])}
-Tamaño promedio: {FileUtils.format_file_size(stats['average_size'])}
-
-Tipos de archivo encontrados:
-"""
+            format_size = FileUtils.format_file_size
+            lines = [
+                "Información de la carpeta seleccionada:",
+                "",
+                f"Total de archivos: {stats['total_files']}",
+                f"Tamaño total: {format_size(stats['total_size'])}",
+                f"Tamaño promedio: {format_size(stats['average_size'])}",
+                "",
+                "Tipos de archivo encontrados:"
+            ]
+            lines.extend(f"  {ext}: {count} archivo(s)" for ext, count in stats['extensions'].items())
             
-            for ext, count in stats['extensions'].items():
-                info_text += f"  {ext}: {count} archivo(s)\n"
+            info_text = '\n'.join(lines) + '\n'
             
-            if stats['largest_file']:
-                info_text += f"\nArchivo más grande: {stats['largest_file']['name']} ({FileUtils.format_file_size(stats['largest_file']['size'])})"
+            largest = stats['largest_file']
+            if largest:
+                info_text += f"\nArchivo más grande: {largest['name']} ({format_size(largest['size'])})"
             
-            if stats['smallest_file']:
-                info_text += f"\nArchivo más pequeño: {stats['smallest_file']['name']} ({FileUtils.format_file_size(stats['smallest_file']['size'])})"
+            smallest = stats['smallest_file']
+            if smallest:
+                info_text += f"\nArchivo más pequeño: {smallest['name']} ({format_size(smallest['size'])})"
             
-            self.update_info_display(info_text)
+            return info_text
             
         except Exception as e:
-            self.update_info_display(f"Error al analizar carpeta: {e}")
+            return f"Error al analizar carpeta: {e}"
+    
+    def _on_scan_done(self, token: int, text: str):
+        """Muestra el resultado de un escaneo si sigue siendo el más reciente."""
+        if token != self._scan_token:
+            return
+        self.update_info_display(text)
     
     def update_info_display(self, text: str):
         """Actualiza el display de información."""
-        self.info_text.config(state=tk.NORMAL)
         self.info_text.delete(1.0, tk.END)
         self.info_text.insert(1.0, text)
-        self.info_text.config(state=tk.DISABLED)
     
     def start_compression(self):
         """Inicia el proceso de compresión."""
@@ -608,6 +842,8 @@ Tipos de archivo encontrados:
             daemon=True
         )
         self.processing_thread.start()
+        if self._progress_pump_id is None:
+            self._pump_progress()
     
     def run_compression(self, config: CompressionConfig):
         """Ejecuta el proceso de compresión en hilo separado."""
@@ -638,6 +874,8 @@ Tipos de archivo encontrados:
     
     def on_compression_complete(self, result):
         """Maneja la finalización del proceso de compresión."""
+        self._flush_progress()
+        self._invalidate_session_stats()
         self.is_processing = False
         self.start_button.config(state=tk.NORMAL)
         self.pause_button.config(state=tk.DISABLED, text="Pausar")
@@ -669,6 +907,7 @@ Tipos de archivo encontrados:
     
     def on_compression_error(self, error_msg: str):
         """Maneja errores críticos en el proceso de compresión."""
+        self._flush_progress()
         self.is_processing = False
         self.start_button.config(state=tk.NORMAL)
         self.pause_button.config(state=tk.DISABLED, text="Pausar")
@@ -678,18 +917,66 @@ Tipos de archivo encontrados:
         messagebox.showerror("Error Crítico", f"Error en el proceso de compresión:\n\n{error_msg}")
     
     def update_progress(self, current: int, total: int, current_file: str):
-        """Actualiza la barra de progreso y información."""
+        """Registra el progreso notificado por el compresor.
+        
+        Se invoca desde el hilo de compresión, por lo que no toca Tk;
+        _pump_progress muestra el valor más reciente.
+        """
+        self._progress_state = (current, total, current_file)
+    
+    def _pump_progress(self):
+        """Refresca la barra de progreso con el último estado mientras dura la compresión."""
+        self._flush_progress()
+        if self.is_processing:
+            self._progress_pump_id = self.root.after(self.PROGRESS_PUMP_INTERVAL_MS, self._pump_progress)
+        else:
+            self._progress_pump_id = None
+    
+    def _flush_progress(self):
+        """Actualiza la barra de progreso y la información si llegó un estado nuevo."""
+        state = self._progress_state
+        if state is None or state is self._progress_rendered:
+            return
+        self._progress_rendered = state
+        
+        current, total, current_file = state
         if total > 0:
             percentage = (current / total) * 100
             self.progress_var.set(percentage)
             self.progress_label.config(text=f"Progreso: {current}/{total} ({percentage:.1f}%)")
         
         self.current_file_label.config(text=f"Archivo actual: {current_file}")
-        
-        # Actualizar estadísticas de sesión
-        stats = self.logger.get_session_stats()
-        if stats:
-            self.update_statistics_display(stats)
+    
+    def _stats_tick(self):
+        """Consulta periódicamente las estadísticas de sesión durante el proceso."""
+        if self.is_processing:
+            # Actualizar estadísticas de sesión cuando Tk quede libre
+            stats = self._get_session_stats()
+            if stats:
+                self._stats_state = stats
+                if self._stats_idle is None:
+                    self._stats_idle = self.root.after_idle(self._render_pending_stats)
+        
+        self.root.after(self.STATS_REFRESH_INTERVAL_MS, self._stats_tick)
+    
+    def _get_session_stats(self) -> Optional[Dict[str, Any]]:
+        """Devuelve las estadísticas de sesión, reutilizándolas durante SESSION_STATS_TTL."""
+        now = time.monotonic()
+        if now >= self._stats_expiry:
+            self._cached_stats = self.logger.get_session_stats()
+            self._stats_expiry = now + self.SESSION_STATS_TTL
+        return self._cached_stats
+    
+    def _invalidate_session_stats(self):
+        """Fuerza a consultar de nuevo las estadísticas de sesión."""
+        self._cached_stats = None
+        self._stats_expiry = 0.0
+    
+    def _render_pending_stats(self):
+        """Muestra las últimas estadísticas de sesión pendientes."""
+        self._stats_idle = None
+        if self._stats_state is not None:
+            self.update_statistics_display(self._stats_state)
     
     def update_file_status(self, operation: str, filename: str, status: str):
         """Actualiza el estado de procesamiento de archivos."""
@@ -697,39 +984,95 @@ Tipos de archivo encontrados:
         pass
     
     def update_log_display(self, level: str, message: str, file_path: str):
-        """Actualiza el display de log en tiempo real."""
-        # Verificar que log_text esté disponible
-        if not hasattr(self, 'log_text') or not self.log_text:
-            return
-            
-        timestamp = TimeUtils.format_timestamp()
-        log_entry = f"[{timestamp}] {level}: {message}\n"
-        
+        """Encola un registro de log para mostrarlo en el siguiente volcado.
+        
+        Se invoca desde el hilo del logger, por lo que no toca Tk.
+        """
+        # Reformatear la marca de tiempo solo cuando cambia el segundo
+        now = int(time.time())
+        if now != self._last_ts_int:
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._last_ts_int = now
+        timestamp = self._last_ts_str
+        self._log_queue.append((level, f"[{timestamp}] {level}: {message}\n"))
+    
+    def _pump_log(self):
+        """Vuelca al widget de log los registros pendientes en una sola inserción."""
+        entries = []
         try:
-            self.log_text.config(state=tk.NORMAL)
-            self.log_text.insert(tk.END, log_entry, level)
-            self.log_text.see(tk.END)
-            self.log_text.config(state=tk.DISABLED)
-        except Exception as e:
-            # Si hay error, simplemente ignorar para no bloquear la aplicación
+            while True:
+                entries.append(self._log_queue.popleft())
+        except IndexError:
             pass
+        
+        if entries:
+            try:
+                line = self._log_line_count
+                
+                # Agrupar registros consecutivos del mismo nivel en pares
+                # (texto, etiqueta) para insertarlos con una única llamada
+                chunks = []
+                run_level, run_text = entries[0][0], []
+                for level, entry in entries:
+                    if level != run_level:
+                        chunks += (''.join(run_text), run_level)
+                        run_level, run_text = level, []
+                    run_text.append(entry)
+                    line += entry.count('\n')
+                chunks += (''.join(run_text), run_level)
+                
+                self.log_text.insert(tk.END, *chunks)
+                self._log_line_count = line
+                
+                # Recortar las líneas más antiguas; sus etiquetas se van con el texto
+                overflow = self._log_line_count - self._log_max_lines
+                if overflow > 0:
+                    self.log_text.delete('1.0', f'{overflow + 1}.0')
+                    self._log_line_count = self._log_max_lines
+                
+                self.log_text.see(tk.END)
+            except tk.TclError:
+                # Si hay error, simplemente ignorar para no bloquear la aplicación
+                pass
+        
+        self.root.after(self.LOG_PUMP_INTERVAL_MS, self._pump_log)
     
     def update_statistics_display(self, stats: Dict[str, Any]):
         """Actualiza el display de estadísticas."""
-        self.processed_label.config(text=f"Procesados: {stats.get('processed_files', 0)}")
-        self.failed_label.config(text=f"Errores: {stats.get('failed_files', 0)}")
-        self.skipped_label.config(text=f"Omitidos: {stats.get('skipped_files', 0)}")
-        
-        self.compression_ratio_label.config(text=f"Ratio de compresión: {stats.get('compression_ratio', 0):.1f}%")
-        self.space_saved_label.config(text=f"Espacio ahorrado: {FileUtils.format_file_size(stats.get('space_saved', 0))}")
-        self.success_rate_label.config(text=f"Tasa de éxito: {stats.get('success_rate', 0):.1f}%")
+        # Una actualización directa sustituye a la pendiente
+        if self._stats_idle is not None:
+            self.root.after_cancel(self._stats_idle)
+            self._stats_idle = None
+        if stats == self._stats_rendered:
+            return
+        self._stats_rendered = dict(stats)
+        
+        texts = (
+            (self.processed_label, f"Procesados: {stats.get('processed_files', 0)}"),
+            (self.failed_label, f"Errores: {stats.get('failed_files', 0)}"),
+            (self.skipped_label, f"Omitidos: {stats.get('skipped_files', 0)}"),
+            (self.compression_ratio_label, f"Ratio de compresión: {stats.get('compression_ratio', 0):.1f}%"),
+            (self.space_saved_label, f"Espacio ahorrado: {FileUtils.format_file_size(stats.get('space_saved', 0))}"),
+            (self.success_rate_label, f"Tasa de éxito: {stats.get('success_rate', 0):.1f}%"),
+            # Actualizar tiempo
+            (self.time_label, f"Tiempo transcurrido: {stats.get('duration', '0s')}")
+        )
         
-        # Actualizar tiempo
-        duration = stats.get('duration', '0s')
-        self.time_label.config(text=f"Tiempo transcurrido: {duration}")
+        # Solo reconfigurar las etiquetas cuyo texto cambió
+        last_texts = self._last_stats_texts
+        for label, text in texts:
+            if last_texts.get(label) != text:
+                label.config(text=text)
+                last_texts[label] = text
     
     def reset_statistics(self):
         """Reinicia las estadísticas mostradas."""
+        self._progress_state = None
+        self._progress_rendered = None
+        self._stats_state = None
+        self._stats_rendered = None
+        self._last_stats_texts.clear()
+        self._invalidate_session_stats()
         self.progress_var.set(0)
         self.current_file_label.config(text="Archivo actual: -")
         self.progress_label.config(text="Progreso: 0/0 (0%)")
@@ -745,9 +1088,8 @@ Tipos de archivo encontrados:
     
     def clear_log(self):
         """Limpia el display de log."""
-        self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        self._log_line_count = 0
     
     def export_log(self):
         """Exporta el log actual a un archivo."""
@@ -759,9 +1101,13 @@ Tipos de archivo encontrados:
         
         if filename:
             try:
-                log_content = self.log_text.get(1.0, tk.END)
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(log_content)
+                # Copiar el contenido por bloques de líneas para no duplicar
+                # todo el log en memoria
+                last_line = int(self.log_text.index('end-1c').split('.')[0])
+                step = self.LOG_EXPORT_CHUNK_LINES
+                with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    for line in range(1, last_line + 1, step):
+                        f.write(self.log_text.get(f'{line}.0', f'{line + step}.0'))
                 messagebox.showinfo("Exportación Exitosa", f"Log exportado a: {filename}")
             except Exception as e:
                 messagebox.showerror("Error de Exportación", f"Error al exportar log: {e}")
@@ -771,26 +1117,42 @@ Tipos de archivo encontrados:
         # Obtener filtros de archivo
         filter_preset = self.file_filter_var.get()
         if filter_preset == 'personalizado':
-            filters = [f.strip() for f in self.custom_filters_var.get().split(',')]
+            filters = list(map(str.strip, self.custom_filters_var.get().split(',')))
         else:
-            presets = self.config_manager.config_data.get('file_filters_presets', {})
-            filters = presets.get(filter_preset, ['*'])
-        
-        return {
-            'source_folder': self.source_var.get(),
-            'backup_folder': self.backup_var.get(),
-            'naming_pattern': self.naming_pattern_var.get(),
-            'custom_pattern': self.custom_pattern_var.get(),
-            'include_subfolders': self.include_subfolders_var.get(),
-            'file_filters': filters,
-            'compression_level': int(self.compression_level_var.get()),
-            'conflict_resolution': self.conflict_resolution_var.get(),
-            'verify_integrity': self.verify_integrity_var.get()
+            # Presets de la instantánea de configuración (se renueva al cargar perfil)
+            filters = self._config_snapshot['filters'].get(filter_preset, self.DEFAULT_FILE_FILTERS)
+        
+        # Las claves sin variable (None) se calculan aparte
+        config = {key: var.get() if var is not None else filters
+                  for key, var in self._config_vars}
+        config['compression_level'] = int(config['compression_level'])
+        return config
+    
+    def _refresh_config_snapshot(self):
+        """Relee las opciones de configuración usadas por las pestañas.
+        
+        Si la pestaña de configuración ya está construida, actualiza sus
+        listas solo cuando las opciones han cambiado.
+        """
+        snapshot = {
+            'naming': self.config_manager.get_naming_patterns(),
+            'filters': self.config_manager.config_data.get('file_filters_presets', {}),
+            'conflicts': self.config_manager.get_conflict_resolutions()
         }
+        if snapshot == self._config_snapshot:
+            return
+        self._config_snapshot = snapshot
+        
+        if self._tab_built['config']:
+            self.pattern_combo['values'] = list(snapshot['naming'])
+            self.filter_combo['values'] = list(snapshot['filters'])
+            self.conflict_combo['values'] = list(snapshot['conflicts'])
     
     def load_current_profile(self):
         """Carga el perfil actual en la UI."""
-        profile = self.config_manager.get_profile(self.current_profile)
+        self._refresh_config_snapshot()
+        
+        profile = self._profile_cache.get(self.current_profile)
         if not profile:
             return
         
@@ -807,33 +1169,80 @@ Tipos de archivo encontrados:
         
         # Actualizar lista de perfiles
         self.update_profiles_combo()
+        
+        # Los valores recién cargados coinciden con el perfil guardado
+        self._profile_dirty = False
+    
+    def _mark_profile_dirty(self, *args):
+        """Registra que la configuración del perfil ha cambiado."""
+        self._profile_dirty = True
+    
+    def _reload_profile_cache(self):
+        """Renueva la caché de perfiles desde el gestor de configuración."""
+        self._profile_cache = self.config_manager.get_all_profiles()
+        self._profile_generation += 1
     
     def update_profiles_combo(self):
         """Actualiza el combo de perfiles."""
-        profiles = self.config_manager.list_profiles()
-        self.profile_combo['values'] = profiles
+        profiles = list(self._profile_cache)
+        if self._tab_built['profiles']:
+            self.profile_combo['values'] = profiles
         if self.current_profile not in profiles:
             self.current_profile = 'default'
         self.current_profile_var.set(self.current_profile)
     
     def update_profiles_list(self):
-        """Actualiza la lista de perfiles en el TreeView."""
-        # Limpiar lista actual
-        for item in self.profiles_tree.get_children():
-            self.profiles_tree.delete(item)
-        
-        # Agregar perfiles
-        profiles = self.config_manager.list_profiles()
-        for profile_name in profiles:
-            profile = self.config_manager.get_profile(profile_name)
-            if profile:
-                self.profiles_tree.insert('', tk.END, values=(
-                    profile_name,
-                    profile.get('naming_pattern', '-'),
-                    profile.get('backup_folder', '-'),
-                    'Sí' if profile.get('include_subfolders', False) else 'No',
-                    profile.get('last_modified', '-')[:19] if profile.get('last_modified') else '-'
-                ))
+        """Actualiza la lista de perfiles en el TreeView.
+        
+        Solo elimina, inserta o modifica las filas que han cambiado desde
+        la última actualización, y no hace nada si la caché de perfiles no
+        se ha renovado desde entonces.
+        """
+        if not self._tab_built['profiles']:
+            return
+        if self._profile_rows_generation == self._profile_generation:
+            return
+        
+        rows = {}
+        stamps = {}
+        previous = self._profile_rows
+        for profile_name, profile in self._profile_cache.items():
+            if not profile:
+                continue
+            
+            # Reutilizar la fila ya formateada si el perfil no se ha vuelto a guardar
+            last_modified = profile.get('last_modified')
+            stamps[profile_name] = last_modified
+            current = previous.get(profile_name)
+            if (current is not None and last_modified
+                    and self._profile_row_stamps.get(profile_name) == last_modified):
+                rows[profile_name] = current
+                continue
+            
+            rows[profile_name] = (
+                profile_name,
+                profile.get('naming_pattern', '-'),
+                profile.get('backup_folder', '-'),
+                'Sí' if profile.get('include_subfolders', False) else 'No',
+                last_modified[:19] if last_modified else '-'
+            )
+        
+        # Eliminar perfiles que ya no existen
+        removed = [name for name in self._profile_rows if name not in rows]
+        if removed:
+            self.profiles_tree.delete(*removed)
+        
+        # Agregar perfiles nuevos y actualizar los modificados
+        for name, values in rows.items():
+            current = self._profile_rows.get(name)
+            if current is None:
+                self.profiles_tree.insert('', tk.END, iid=name, values=values)
+            elif current != values:
+                self.profiles_tree.item(name, values=values)
+        
+        self._profile_rows = rows
+        self._profile_row_stamps = stamps
+        self._profile_rows_generation = self._profile_generation
     
     def on_profile_change(self, event=None):
         """Maneja el cambio de perfil seleccionado."""
@@ -856,6 +1265,8 @@ Tipos de archivo encontrados:
                          if k not in ['source_folder']}
         
         if self.config_manager.save_profile(self.current_profile, profile_config):
+            self._reload_profile_cache()
+            self._profile_dirty = False
             self.update_profiles_list()
             self.status_label.config(text=f"Perfil guardado: {self.current_profile}")
             messagebox.showinfo("Perfil Guardado", f"Perfil '{self.current_profile}' guardado exitosamente")
@@ -864,18 +1275,15 @@ Tipos de archivo encontrados:
     
     def new_profile(self):
         """Crea un nuevo perfil."""
-        from tkinter import simpledialog
-        
         name = simpledialog.askstring("Nuevo Perfil", "Nombre del nuevo perfil:")
         if name:
-            from utils.validators import InputValidator
             valid, error = InputValidator.validate_profile_name(name)
             if not valid:
                 messagebox.showerror("Nombre Inválido", error)
                 return
             
             # Verificar si ya existe
-            if name in self.config_manager.list_profiles():
+            if name in self._profile_cache:
                 messagebox.showerror("Error", "Ya existe un perfil con ese nombre")
                 return
             
@@ -885,6 +1293,8 @@ Tipos de archivo encontrados:
                              if k not in ['source_folder']}
             
             if self.config_manager.save_profile(name, profile_config):
+                self._reload_profile_cache()
+                self._profile_dirty = False
                 self.current_profile = name
                 self.update_profiles_combo()
                 self.update_profiles_list()
@@ -902,6 +1312,7 @@ Tipos de archivo encontrados:
         if messagebox.askyesno("Confirmar Eliminación", 
                               f"¿Está seguro de eliminar el perfil '{self.current_profile}'?"):
             if self.config_manager.delete_profile(self.current_profile):
+                self._reload_profile_cache()
                 self.current_profile = 'default'
                 self.load_current_profile()
                 self.update_profiles_list()
@@ -912,25 +1323,23 @@ Tipos de archivo encontrados:
     
     def duplicate_profile(self):
         """Duplica el perfil actual."""
-        from tkinter import simpledialog
-        
         name = simpledialog.askstring("Duplicar Perfil", 
                                      f"Nombre para la copia de '{self.current_profile}':")
         if name:
-            from utils.validators import InputValidator
             valid, error = InputValidator.validate_profile_name(name)
             if not valid:
                 messagebox.showerror("Nombre Inválido", error)
                 return
             
             # Verificar si ya existe
-            if name in self.config_manager.list_profiles():
+            if name in self._profile_cache:
                 messagebox.showerror("Error", "Ya existe un perfil con ese nombre")
                 return
             
             # Obtener configuración del perfil actual
-            current_config = self.config_manager.get_profile(self.current_profile)
+            current_config = self._profile_cache.get(self.current_profile)
             if current_config and self.config_manager.save_profile(name, current_config):
+                self._reload_profile_cache()
                 self.update_profiles_combo()
                 self.update_profiles_list()
                 self.status_label.config(text=f"Perfil duplicado: {name}")
@@ -948,6 +1357,7 @@ Tipos de archivo encontrados:
         if filename:
             imported_name = self.config_manager.import_profile(filename)
             if imported_name:
+                self._reload_profile_cache()
                 self.update_profiles_combo()
                 self.update_profiles_list()
                 self.status_label.config(text=f"Perfil importado: {imported_name}")
@@ -973,13 +1383,11 @@ Tipos de archivo encontrados:
     def clean_logs(self):
         """Limpia logs antiguos."""
         if messagebox.askyesno("Limpiar Logs", "¿Desea limpiar los archivos de log antiguos?"):
-            self.logger.cleanup_old_logs()
-            messagebox.showinfo("Logs Limpiados", "Archivos de log antiguos eliminados")
+            deleted = self.logger.cleanup_old_logs()
+            messagebox.showinfo("Logs Limpiados", f"Archivos de log antiguos eliminados: {len(deleted)}")
     
     def check_system(self):
         """Verifica el estado del sistema."""
-        from utils.helpers import get_system_info
-        
         info = get_system_info()
         info_text = "Información del Sistema:\n\n"
         
@@ -992,7 +1400,7 @@ Tipos de archivo encontrados:
         """Muestra estadísticas de uso de la aplicación."""
         try:
             # Obtener estadísticas del logger
-            session_stats = self.logger.get_session_stats() or {}
+            session_stats = self._get_session_stats() or {}
             
             # Obtener estadísticas generales
             total_processed = session_stats.get('processed_files', 0)
@@ -1035,18 +1443,14 @@ Tipos de archivo encontrados:
         if size_bytes == 0:
             return "0 B"
         
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        import math
-        i = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2)
+        # La unidad sale de la magnitud binaria: cada 10 bits es un múltiplo de 1024
+        size_names = self.SIZE_UNITS
+        i = 0 if size_bytes < 1024 else min((int(size_bytes).bit_length() - 1) // 10, len(size_names) - 1)
+        s = round(size_bytes / (1 << (10 * i)), 2)
         return f"{s} {size_names[i]}"
 
     def show_manual(self):
         """Muestra el manual de usuario de la aplicación."""
-        import webbrowser
-        import os
-        
         manual_path = Path("MANUAL_USUARIO.md")
         
         if manual_path.exists():
@@ -1056,26 +1460,7 @@ Tipos de archivo encontrados:
                 self.status_label.config(text="Manual de usuario abierto en el navegador")
             except Exception as e:
                 # Si falla, mostrar contenido en un diálogo
-                try:
-                    with open(manual_path, 'r', encoding='utf-8') as f:
-                        content = f.read()[:2000]  # Primeros 2000 caracteres
-                    
-                    manual_window = tk.Toplevel(self.root)
-                    manual_window.title("📖 Manual de Usuario")
-                    manual_window.geometry("800x600")
-                    
-                    text_widget = tk.Text(manual_window, wrap=tk.WORD, padx=10, pady=10)
-                    scrollbar = ttk.Scrollbar(manual_window, orient="vertical", command=text_widget.yview)
-                    text_widget.configure(yscrollcommand=scrollbar.set)
-                    
-                    text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-                    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-                    
-                    text_widget.insert(tk.END, content)
-                    text_widget.config(state=tk.DISABLED)
-                    
-                except Exception as e2:
-                    messagebox.showerror("Error", f"No se pudo abrir el manual: {e2}")
+                self._show_manual_fallback(manual_path)
         else:
             messagebox.showwarning(
                 "Manual no encontrado", 
@@ -1084,6 +1469,53 @@ Tipos de archivo encontrados:
                 "https://github.com/Doberman156/AutoCompresor/blob/main/MANUAL_USUARIO.md"
             )
     
+    def _show_manual_fallback(self, manual_path: Path):
+        """Muestra el inicio del manual en una ventana propia.
+        
+        El archivo se lee en el pool de trabajo la primera vez y el extracto
+        queda en caché para las siguientes.
+        """
+        if self._manual_cache is not None:
+            self._open_manual_window(self._manual_cache)
+            return
+        
+        def read_manual():
+            try:
+                with open(manual_path, 'r', encoding='utf-8') as f:
+                    content = f.read(2000)  # Primeros 2000 caracteres
+            except Exception as e:
+                error = f"No se pudo abrir el manual: {e}"
+                self.root.after(0, lambda: messagebox.showerror("Error", error))
+                return
+            self.root.after(0, self._cache_and_open_manual, content)
+        
+        self._scan_pool.submit(read_manual)
+    
+    def _cache_and_open_manual(self, content: str):
+        """Guarda el extracto del manual y lo muestra."""
+        self._manual_cache = content
+        self._open_manual_window(content)
+    
+    def _open_manual_window(self, content: str):
+        """Crea la ventana que muestra el extracto del manual."""
+        try:
+            manual_window = tk.Toplevel(self.root)
+            manual_window.title("📖 Manual de Usuario")
+            manual_window.geometry("800x600")
+            
+            text_widget = tk.Text(manual_window, wrap=tk.WORD, padx=10, pady=10)
+            scrollbar = ttk.Scrollbar(manual_window, orient="vertical", command=text_widget.yview)
+            text_widget.configure(yscrollcommand=scrollbar.set)
+            
+            text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            text_widget.insert(tk.END, content)
+            text_widget.config(state=tk.DISABLED)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo abrir el manual: {e}")
+    
     def show_about(self):
         """Muestra información sobre la aplicación."""
         about_text = """Automatización de Compresión de Archivos v1.0.21
@@ -1107,17 +1539,72 @@ Características:
         messagebox.showinfo("Acerca de", about_text)
     
     def update_system_info(self):
-        """Actualiza la información del sistema en la barra de estado."""
+        """Actualiza la información del sistema en la barra de estado.
+        
+        La lectura se hace en el pool de trabajo y el resultado se muestra
+        desde el hilo principal. Con la ventana minimizada no se consulta.
+        """
+        if self.root.state() == 'iconic':
+            self.root.after(self.SYSTEM_INFO_HIDDEN_MS, self.update_system_info)
+            return
+        
         try:
-            import psutil
-            memory = psutil.virtual_memory()
-            cpu = psutil.cpu_percent()
-            self.system_label.config(text=f"CPU: {cpu}% | RAM: {memory.percent}%")
-        except ImportError:
-            self.system_label.config(text="Sistema: OK")
+            future = self._scan_pool.submit(self._collect_system_info)
+        except RuntimeError:
+            # El pool ya se cerró: la aplicación está terminando
+            return
+        future.add_done_callback(
+            lambda f: self._call_in_ui(self._show_system_info, f.result())
+        )
+    
+    def _call_in_ui(self, callback, *args):
+        """Programa callback en el hilo de Tk desde un hilo de fondo.
         
-        # Programar próxima actualización
-        self.root.after(5000, self.update_system_info)
+        Si la ventana ya se destruyó (cierre durante la tarea) no hace nada.
+        """
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass
+    
+    def _collect_system_info(self) -> Optional[str]:
+        """Obtiene el uso de CPU y memoria (se ejecuta fuera del hilo de Tk).
+        
+        Returns:
+            Texto a mostrar, o None si solo se ha iniciado la medición de CPU
+        """
+        psutil = self._psutil
+        if psutil is None:
+            # Importar una sola vez, en la primera lectura
+            try:
+                import psutil
+            except ImportError:
+                self._system_info_available = False
+                return "Sistema: OK"
+            self._psutil = psutil
+        
+        if not self._cpu_primed:
+            # La primera llamada sin intervalo solo fija la referencia
+            psutil.cpu_percent(interval=None)
+            self._cpu_primed = True
+            return None
+        
+        memory = psutil.virtual_memory()
+        cpu = psutil.cpu_percent(interval=None)
+        return f"CPU: {cpu}% | RAM: {memory.percent}%"
+    
+    def _show_system_info(self, text: Optional[str]):
+        """Muestra la información del sistema y programa la próxima lectura."""
+        if text is not None:
+            self.system_label.config(text=text)
+        
+        # Sin psutil el texto no cambia: no hace falta volver a consultar
+        if not self._system_info_available:
+            return
+        
+        # Programar próxima actualización (pronto si solo se inició la medición)
+        delay = self.SYSTEM_INFO_INTERVAL_MS if text is not None else self.SYSTEM_INFO_PRIME_MS
+        self.root.after(delay, self.update_system_info)
     
     # Métodos del sistema de actualizaciones
     def _init_updater(self):
@@ -1125,6 +1612,7 @@ Características:
         try:
             config = self.config_manager.get_config()
             update_settings = config.get('updates', {})
+            self._dismissed_versions.update(update_settings.get('dismissed_versions', []))
             
             self.update_config = UpdateConfig(
                 update_server_url=update_settings.get('update_server_url', 'https://api.github.com/repos/Doberman156/AutoCompresor/releases'),
@@ -1136,6 +1624,10 @@ Características:
                 allow_prereleases=update_settings.get('allow_prereleases', False)
             )
             
+            # Cerrar la sesión HTTP del actualizador anterior
+            if self.updater:
+                self.updater.close()
+            
             self.updater = Updater(self.update_config, self.logger)
             
         except Exception as e:
@@ -1153,23 +1645,30 @@ Características:
         if not update_settings.get('auto_check', True):
             return
         
-        # Verificar en hilo separado para no bloquear la UI
+        # No lanzar nada si la última verificación es reciente
+        if not self.updater.should_check_for_updates():
+            return
+        
+        # Verificar en un hilo demonio: la petición puede tardar hasta 30 s y
+        # no debe retrasar los escaneos del pool ni impedir salir al cerrar
         def check_updates():
             try:
-                # Esperar un poco para que la UI se cargue completamente
-                import time
-                time.sleep(2)
+                # Sin conexión con el servidor no tiene sentido esperar a la petición
+                if not self.updater.is_server_reachable():
+                    self.logger.log_operation('INFO', 'Sin conexión: verificación de actualizaciones omitida')
+                    return
                 
                 update_info = self.updater.check_for_updates()
-                if update_info:
+                if update_info and update_info.version in self._dismissed_versions:
+                    self.logger.log_operation('INFO', f'Actualización v{update_info.version} omitida por el usuario')
+                elif update_info:
                     # Mostrar notificación en el hilo principal
-                    self.root.after(0, lambda: self._show_update_notification(update_info))
+                    self._call_in_ui(self._show_update_notification, update_info)
                     
             except Exception as e:
                 self.logger.log_operation('WARNING', f'Error al verificar actualizaciones: {e}')
         
-        update_thread = threading.Thread(target=check_updates, daemon=True)
-        update_thread.start()
+        threading.Thread(target=check_updates, daemon=True).start()
     
     def _show_update_notification(self, update_info: UpdateInfo):
         """Muestra la notificación de actualización disponible."""
@@ -1209,22 +1708,21 @@ Características:
             )
     
     def _dismiss_update(self, update_info: UpdateInfo):
-        """Marca una actualización como omitida."""
-        try:
-            config = self.config_manager.get_config()
-            update_settings = config.get('updates', {})
-            dismissed = update_settings.get('dismissed_versions', [])
+        """Marca una actualización como omitida (se guarda al cerrar)."""
+        if update_info.version not in self._dismissed_versions:
+            self._dismissed_versions.add(update_info.version)
+            self._dismissed_dirty = True
             
-            if update_info.version not in dismissed:
-                dismissed.append(update_info.version)
-                update_settings['dismissed_versions'] = dismissed
-                config['updates'] = update_settings
-                self.config_manager.save_config(config)
-                
-                self.logger.log_operation('INFO', f'Actualización v{update_info.version} omitida')
-                
-        except Exception as e:
-            self.logger.log_operation('ERROR', f'Error al omitir actualización: {e}')
+            self.logger.log_operation('INFO', f'Actualización v{update_info.version} omitida')
+    
+    def _save_dismissed_versions(self):
+        """Guarda las versiones omitidas si cambiaron durante la sesión."""
+        if not self._dismissed_dirty:
+            return
+        if self.config_manager.set_update_setting('dismissed_versions', sorted(self._dismissed_versions)):
+            self._dismissed_dirty = False
+        else:
+            self.logger.log_operation('ERROR', 'Error al guardar las actualizaciones omitidas')
     
     def check_for_updates_manual(self):
         """Verifica actualizaciones manualmente desde el menú."""
@@ -1299,10 +1797,17 @@ Características:
                 self.root.after(1000, self.force_close)
             return
         
-        # Guardar configuración actual
-        self.save_current_profile()
+        # Guardar configuración actual solo si cambió
+        if self._profile_dirty:
+            self.save_current_profile()
+        self._save_dismissed_versions()
+        
+        # Detener el hilo de trabajo de la pestaña de renombrado
+        if getattr(self, 'rename_tab', None):
+            self.rename_tab.shutdown()
         
-        # Cerrar logger
+        # Cerrar logger y pool de escaneo
+        self._scan_pool.shutdown(wait=False, cancel_futures=True)
         self.logger.shutdown()
         
         # Cerrar aplicación
@@ -1310,6 +1815,10 @@ Características:
     
     def force_close(self):
         """Fuerza el cierre de la aplicación."""
+        self._save_dismissed_versions()
+        if getattr(self, 'rename_tab', None):
+            self.rename_tab.shutdown()
+        self._scan_pool.shutdown(wait=False, cancel_futures=True)
         self.logger.shutdown()
         self.root.destroy()
     
@@ -9,20 +9,35 @@ incluyendo operaciones, vista previa y aplicación de cambios.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Union
 import os
+import re
 
 # Importar módulos del core y utils
-from core.renamer import FileRenamer, RenameOperation, FileRenamePreview
+from core.renamer import FileRenamer, RenameOperation, FileRenamePreview, compile_file_filters
 from utils.rename_operations import RenameTemplates, FileNameValidator, TextProcessor, NumberingHelper
-from utils.helpers import FileUtils
 
 
 class RenameTab:
     """Pestaña de renombrado masivo de archivos."""
     
+    # Espera tras la última edición de una operación antes de regenerar
+    # la vista previa
+    PREVIEW_DEBOUNCE_MS = 180
+    # Filas de la vista previa que se insertan de una vez: al mostrarla y
+    # cada vez que el desplazamiento se acerca al final
+    PREVIEW_TREE_CHUNK = 500
+    # Fracción visible a partir de la cual se cargan más filas
+    PREVIEW_TREE_PREFETCH = 0.9
+    # Refresco de la barra de progreso durante el renombrado (~30 Hz)
+    PROGRESS_INTERVAL_MS = 33
+    
+    # Operaciones de la interfaz en el orden en que se aplican
+    OPERATION_ORDER = ('prefix', 'suffix', 'replace', 'remove',
+                       'numbering', 'case', 'padding', 'remove_padding')
+    
     def __init__(self, parent_notebook, config_manager, logger):
         """Inicializa la pestaña de renombrado."""
         self.parent_notebook = parent_notebook
@@ -34,8 +49,34 @@ class RenameTab:
         
         # Variables de estado
         self.is_processing = False
-        self.processing_thread: Optional[threading.Thread] = None
         self.current_preview: List[FileRenamePreview] = []
+        self.current_conflicts: Dict[str, List[str]] = self._empty_conflicts()
+        
+        # Un único hilo de trabajo para todo lo que toca el renombrador
+        # (carga, vista previa y renombrado), así las tareas se serializan;
+        # solo se muestra el resultado del trabajo más reciente
+        self._worker = ThreadPoolExecutor(max_workers=1)
+        self._job_id = 0
+        
+        # Actualización pendiente de la vista previa
+        self._preview_after: Optional[str] = None
+        # Filas de la vista previa ya insertadas en el Treeview (lista virtual)
+        self._tree_loaded = 0
+        self._tree_load_pending = False
+        # Trabajo cuya vista previa sin operaciones (nombres sin cambios) se
+        # está mostrando; mientras siga siendo el último no hay que repetirla
+        self._identity_job = -1
+        
+        # Progreso del renombrado: el hilo de trabajo solo guarda el último
+        # estado y el hilo principal lo muestra si cambió el porcentaje
+        self._rename_progress: Optional[tuple] = None
+        self._progress_pct = -1
+        
+        # Una instancia por tipo de operación; update_operations solo las modifica
+        self._operations: Dict[str, RenameOperation] = {
+            name: RenameOperation(operation_type=name, enabled=False, position=i)
+            for i, name in enumerate(self.OPERATION_ORDER)
+        }
         
         # Variables de UI
         self.setup_variables()
@@ -79,6 +120,18 @@ class RenameTab:
         self.padding_length_var = tk.IntVar(value=6)
         self.remove_padding_enabled_var = tk.BooleanVar()
         
+        # Cualquier cambio en una operación programa la vista previa; un
+        # solo punto de entrada en lugar de command/bind en cada widget
+        for var in (self.prefix_enabled_var, self.prefix_value_var,
+                    self.suffix_enabled_var, self.suffix_value_var,
+                    self.replace_enabled_var, self.replace_old_var, self.replace_new_var,
+                    self.remove_enabled_var, self.remove_value_var,
+                    self.numbering_enabled_var, self.numbering_start_var, self.numbering_padding_var,
+                    self.case_enabled_var, self.case_type_var,
+                    self.padding_enabled_var, self.padding_length_var,
+                    self.remove_padding_enabled_var):
+            var.trace_add('write', self._schedule_preview)
+        
         # Variables de plantillas
         self.template_var = tk.StringVar(value="")
         
@@ -86,6 +139,12 @@ class RenameTab:
         self.total_files_var = tk.StringVar(value="0")
         self.valid_files_var = tk.StringVar(value="0")
         self.conflicts_var = tk.StringVar(value="0")
+        
+        # Filtros de archivo de cada preset, compilados una sola vez
+        filter_presets = self.config_manager.config_data.get('file_filters_presets', {})
+        self._compiled_filters: Dict[str, re.Pattern] = {
+            name: compile_file_filters(patterns) for name, patterns in filter_presets.items()
+        }
     
     def create_tab(self):
         """Crea la pestaña de renombrado."""
@@ -193,7 +252,7 @@ class RenameTab:
         template_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(template_frame, text="📋 Plantilla:").pack(side=tk.LEFT)
-        templates = list(RenameTemplates.get_all_templates().keys())
+        templates = RenameTemplates.get_template_names()
         template_combo = ttk.Combobox(template_frame, textvariable=self.template_var,
                                     values=[""] + templates, state="readonly", width=20)
         template_combo.pack(side=tk.LEFT, padx=5)
@@ -223,32 +282,27 @@ class RenameTab:
         prefix_frame.pack(fill=tk.X, padx=5, pady=2)
         
         ttk.Checkbutton(prefix_frame, text="Activar", 
-                       variable=self.prefix_enabled_var,
-                       command=self.update_preview).pack(side=tk.LEFT)
+                       variable=self.prefix_enabled_var).pack(side=tk.LEFT)
         ttk.Label(prefix_frame, text="Prefijo:").pack(side=tk.LEFT, padx=(10, 5))
         prefix_entry = ttk.Entry(prefix_frame, textvariable=self.prefix_value_var, width=20)
         prefix_entry.pack(side=tk.LEFT, padx=5)
-        prefix_entry.bind('<KeyRelease>', lambda e: self.update_preview())
         
         # Sufijo
         suffix_frame = ttk.LabelFrame(basic_frame, text="Agregar Sufijo", padding=5)
         suffix_frame.pack(fill=tk.X, padx=5, pady=2)
         
         ttk.Checkbutton(suffix_frame, text="Activar", 
-                       variable=self.suffix_enabled_var,
-                       command=self.update_preview).pack(side=tk.LEFT)
+                       variable=self.suffix_enabled_var).pack(side=tk.LEFT)
         ttk.Label(suffix_frame, text="Sufijo:").pack(side=tk.LEFT, padx=(10, 5))
         suffix_entry = ttk.Entry(suffix_frame, textvariable=self.suffix_value_var, width=20)
         suffix_entry.pack(side=tk.LEFT, padx=5)
-        suffix_entry.bind('<KeyRelease>', lambda e: self.update_preview())
         
         # Reemplazar
         replace_frame = ttk.LabelFrame(basic_frame, text="Reemplazar Texto", padding=5)
         replace_frame.pack(fill=tk.X, padx=5, pady=2)
         
         ttk.Checkbutton(replace_frame, text="Activar", 
-                       variable=self.replace_enabled_var,
-                       command=self.update_preview).pack(side=tk.LEFT)
+                       variable=self.replace_enabled_var).pack(side=tk.LEFT)
         
         replace_subframe = ttk.Frame(replace_frame)
         replace_subframe.pack(side=tk.LEFT, padx=10)
@@ -256,24 +310,20 @@ class RenameTab:
         ttk.Label(replace_subframe, text="Buscar:").grid(row=0, column=0, sticky=tk.W)
         replace_old_entry = ttk.Entry(replace_subframe, textvariable=self.replace_old_var, width=15)
         replace_old_entry.grid(row=0, column=1, padx=2)
-        replace_old_entry.bind('<KeyRelease>', lambda e: self.update_preview())
         
         ttk.Label(replace_subframe, text="Reemplazar:").grid(row=0, column=2, sticky=tk.W, padx=(10, 0))
         replace_new_entry = ttk.Entry(replace_subframe, textvariable=self.replace_new_var, width=15)
         replace_new_entry.grid(row=0, column=3, padx=2)
-        replace_new_entry.bind('<KeyRelease>', lambda e: self.update_preview())
         
         # Eliminar
         remove_frame = ttk.LabelFrame(basic_frame, text="Eliminar Texto", padding=5)
         remove_frame.pack(fill=tk.X, padx=5, pady=2)
         
         ttk.Checkbutton(remove_frame, text="Activar", 
-                       variable=self.remove_enabled_var,
-                       command=self.update_preview).pack(side=tk.LEFT)
+                       variable=self.remove_enabled_var).pack(side=tk.LEFT)
         ttk.Label(remove_frame, text="Eliminar:").pack(side=tk.LEFT, padx=(10, 5))
         remove_entry = ttk.Entry(remove_frame, textvariable=self.remove_value_var, width=20)
         remove_entry.pack(side=tk.LEFT, padx=5)
-        remove_entry.bind('<KeyRelease>', lambda e: self.update_preview())
     
     def create_advanced_operations_tab(self):
         """Crea la pestaña de operaciones avanzadas."""
@@ -285,15 +335,13 @@ class RenameTab:
         case_frame.pack(fill=tk.X, padx=5, pady=2)
         
         ttk.Checkbutton(case_frame, text="Activar", 
-                       variable=self.case_enabled_var,
-                       command=self.update_preview).pack(side=tk.LEFT)
+                       variable=self.case_enabled_var).pack(side=tk.LEFT)
         
         ttk.Label(case_frame, text="Tipo:").pack(side=tk.LEFT, padx=(10, 5))
         case_options = ["lower", "upper", "title", "sentence"]
         case_combo = ttk.Combobox(case_frame, textvariable=self.case_type_var,
                                 values=case_options, state="readonly", width=15)
         case_combo.pack(side=tk.LEFT, padx=5)
-        case_combo.bind('<<ComboboxSelected>>', lambda e: self.update_preview())
         
         # Control de Ceros Numéricos
         zeros_frame = ttk.LabelFrame(advanced_frame, text="Control de Ceros Numéricos", padding=5)
@@ -304,14 +352,12 @@ class RenameTab:
         add_zeros_frame.pack(fill=tk.X, pady=2)
         
         ttk.Checkbutton(add_zeros_frame, text="✅ Agregar ceros", 
-                       variable=self.padding_enabled_var,
-                       command=self.update_preview).pack(side=tk.LEFT)
+                       variable=self.padding_enabled_var).pack(side=tk.LEFT)
         
         ttk.Label(add_zeros_frame, text="Longitud total:").pack(side=tk.LEFT, padx=(10, 5))
         padding_spinbox = ttk.Spinbox(add_zeros_frame, textvariable=self.padding_length_var,
-                                    from_=2, to=10, width=8, command=self.update_preview)
+                                    from_=2, to=10, width=8)
         padding_spinbox.pack(side=tk.LEFT, padx=5)
-        padding_spinbox.bind('<KeyRelease>', lambda e: self.update_preview())
         
         ttk.Label(add_zeros_frame, text="Ej: RIPS_M7738.json → RIPS_M007738.json", 
                  style='Subtitle.TLabel').pack(side=tk.LEFT, padx=(15, 0))
@@ -321,8 +367,7 @@ class RenameTab:
         remove_zeros_frame.pack(fill=tk.X, pady=2)
         
         ttk.Checkbutton(remove_zeros_frame, text="❌ Quitar ceros", 
-                       variable=self.remove_padding_enabled_var,
-                       command=self.update_preview).pack(side=tk.LEFT)
+                       variable=self.remove_padding_enabled_var).pack(side=tk.LEFT)
         
         ttk.Label(remove_zeros_frame, text="Ej: RIPS_M007738.json → RIPS_M7738.json", 
                  style='Subtitle.TLabel').pack(side=tk.LEFT, padx=(15, 0))
@@ -350,8 +395,7 @@ class RenameTab:
         auto_num_frame.pack(fill=tk.X, padx=5, pady=2)
         
         ttk.Checkbutton(auto_num_frame, text="Activar numeración", 
-                       variable=self.numbering_enabled_var,
-                       command=self.update_preview).pack(anchor=tk.W, pady=2)
+                       variable=self.numbering_enabled_var).pack(anchor=tk.W, pady=2)
         
         # Configuración de numeración
         num_config_frame = ttk.Frame(auto_num_frame)
@@ -359,15 +403,13 @@ class RenameTab:
         
         ttk.Label(num_config_frame, text="Inicio:").grid(row=0, column=0, sticky=tk.W)
         start_spinbox = ttk.Spinbox(num_config_frame, textvariable=self.numbering_start_var,
-                                  from_=1, to=9999, width=10, command=self.update_preview)
+                                  from_=1, to=9999, width=10)
         start_spinbox.grid(row=0, column=1, padx=5)
-        start_spinbox.bind('<KeyRelease>', lambda e: self.update_preview())
         
         ttk.Label(num_config_frame, text="Ceros:").grid(row=0, column=2, sticky=tk.W, padx=(20, 0))
         padding_spinbox = ttk.Spinbox(num_config_frame, textvariable=self.numbering_padding_var,
-                                    from_=1, to=10, width=10, command=self.update_preview)
+                                    from_=1, to=10, width=10)
         padding_spinbox.grid(row=0, column=3, padx=5)
-        padding_spinbox.bind('<KeyRelease>', lambda e: self.update_preview())
         
         # Vista previa de numeración
         preview_num_frame = ttk.Frame(auto_num_frame)
@@ -415,7 +457,8 @@ class RenameTab:
         # Scrollbars
         v_scrollbar = ttk.Scrollbar(preview_tree_frame, orient=tk.VERTICAL, command=self.preview_tree.yview)
         h_scrollbar = ttk.Scrollbar(preview_tree_frame, orient=tk.HORIZONTAL, command=self.preview_tree.xview)
-        self.preview_tree.config(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self._v_scrollbar = v_scrollbar
+        self.preview_tree.config(yscrollcommand=self._on_tree_yscroll, xscrollcommand=h_scrollbar.set)
         
         # Empaquetar Treeview y scrollbars
         self.preview_tree.grid(row=0, column=0, sticky='nsew')
@@ -453,30 +496,32 @@ class RenameTab:
         """Carga archivos desde la carpeta seleccionada."""
         folder = self.source_folder_var.get()
         if not folder or not os.path.exists(folder):
+            self._job_id += 1
             self.update_file_stats(0, 0, 0)
             return
         
-        try:
-            # Obtener filtros
-            filter_preset = self.file_filter_var.get()
-            filter_presets = self.config_manager.config_data.get('file_filters_presets', {})
-            file_filters = filter_presets.get(filter_preset, ['*'])
-            
-            # Cargar archivos
-            count = self.renamer.load_files_from_folder(
-                folder, 
-                self.include_subfolders_var.get(), 
-                file_filters
-            )
-            
-            self.update_file_stats(count, count, 0)
-            self.update_preview()
-            
-            self.logger.log_operation('INFO', f"Cargados {count} archivos desde {folder}")
-            
-        except Exception as e:
-            self.logger.log_operation('ERROR', f"Error cargando archivos: {str(e)}")
-            messagebox.showerror("Error", f"Error cargando archivos: {str(e)}")
+        # Obtener filtros (ya compilados; sin preset conocido, todos los archivos)
+        file_filters = self._compiled_filters.get(self.file_filter_var.get(), ['*'])
+        
+        # La carga y la vista previa se hacen en el hilo de trabajo; la
+        # vista previa programada queda incluida en este trabajo
+        self._cancel_scheduled_preview()
+        self.status_label.config(text="Cargando archivos...")
+        self._submit_job(self._load_worker, self._on_load_error, folder,
+                         self.include_subfolders_var.get(), file_filters, self.update_operations())
+    
+    def _load_worker(self, job_id: int, folder: str, include_subfolders: bool,
+                     file_filters: Union[List[str], re.Pattern], operations: List[RenameOperation]):
+        """Carga los archivos de la carpeta y genera su vista previa (hilo de trabajo)."""
+        count = self.renamer.load_files_from_folder(folder, include_subfolders, file_filters)
+        self.logger.log_operation('INFO', f"Cargados {count} archivos desde {folder}")
+        return self._preview_worker(job_id, operations)
+    
+    def _on_load_error(self, error_msg: str):
+        """Muestra un error de carga de archivos."""
+        self.status_label.config(text="Error cargando archivos")
+        self.logger.log_operation('ERROR', f"Error cargando archivos: {error_msg}")
+        messagebox.showerror("Error", f"Error cargando archivos: {error_msg}")
     
     def update_file_stats(self, total: int, valid: int, conflicts: int):
         """Actualiza las estadísticas de archivos."""
@@ -560,96 +605,73 @@ class RenameTab:
         
         self.update_preview()
     
-    def update_operations(self):
-        """Actualiza las operaciones del renombrador."""
-        self.renamer.operations.clear()
-        
-        # Agregar operaciones habilitadas
-        if self.prefix_enabled_var.get() and self.prefix_value_var.get():
-            op = RenameOperation(
-                operation_type='prefix',
-                enabled=True,
-                value=self.prefix_value_var.get(),
-                position=len(self.renamer.operations)
-            )
-            self.renamer.add_operation(op)
-        
-        if self.suffix_enabled_var.get() and self.suffix_value_var.get():
-            op = RenameOperation(
-                operation_type='suffix',
-                enabled=True,
-                value=self.suffix_value_var.get(),
-                position=len(self.renamer.operations)
-            )
-            self.renamer.add_operation(op)
-        
-        if self.replace_enabled_var.get() and self.replace_old_var.get():
-            op = RenameOperation(
-                operation_type='replace',
-                enabled=True,
-                old_value=self.replace_old_var.get(),
-                value=self.replace_new_var.get(),
-                position=len(self.renamer.operations)
-            )
-            self.renamer.add_operation(op)
-        
-        if self.remove_enabled_var.get() and self.remove_value_var.get():
-            op = RenameOperation(
-                operation_type='remove',
-                enabled=True,
-                value=self.remove_value_var.get(),
-                position=len(self.renamer.operations)
-            )
-            self.renamer.add_operation(op)
-        
-        if self.numbering_enabled_var.get():
-            op = RenameOperation(
-                operation_type='numbering',
-                enabled=True,
-                start_number=self.numbering_start_var.get(),
-                padding=self.numbering_padding_var.get(),
-                position=len(self.renamer.operations)
-            )
-            self.renamer.add_operation(op)
-        
-        if self.case_enabled_var.get():
-            op = RenameOperation(
-                operation_type='case',
-                enabled=True,
-                case_type=self.case_type_var.get(),
-                position=len(self.renamer.operations)
-            )
-            self.renamer.add_operation(op)
-        
-        if self.padding_enabled_var.get():
-            op = RenameOperation(
-                operation_type='padding',
-                enabled=True,
-                padding_length=self.padding_length_var.get(),
-                position=len(self.renamer.operations)
-            )
-            self.renamer.add_operation(op)
-        
-        if self.remove_padding_enabled_var.get():
-            op = RenameOperation(
-                operation_type='remove_padding',
-                enabled=True,
-                position=len(self.renamer.operations)
-            )
-            self.renamer.add_operation(op)
+    def update_operations(self) -> List[RenameOperation]:
+        """Actualiza las operaciones a partir de la interfaz.
+        
+        Las instancias se crean una vez y aquí solo se cambian sus valores;
+        devuelve las habilitadas en el orden en que se aplican. Lee las
+        variables de Tk (solo en el hilo principal); el hilo de trabajo las
+        aplica al renombrador antes de generar la vista previa.
+        """
+        ops = self._operations
+        
+        prefix = ops['prefix']
+        prefix.value = self.prefix_value_var.get()
+        prefix.enabled = self.prefix_enabled_var.get() and bool(prefix.value)
+        
+        suffix = ops['suffix']
+        suffix.value = self.suffix_value_var.get()
+        suffix.enabled = self.suffix_enabled_var.get() and bool(suffix.value)
+        
+        replace = ops['replace']
+        replace.old_value = self.replace_old_var.get()
+        replace.value = self.replace_new_var.get()
+        replace.enabled = self.replace_enabled_var.get() and bool(replace.old_value)
+        
+        remove = ops['remove']
+        remove.value = self.remove_value_var.get()
+        remove.enabled = self.remove_enabled_var.get() and bool(remove.value)
+        
+        numbering = ops['numbering']
+        numbering.enabled = self.numbering_enabled_var.get()
+        if numbering.enabled:
+            numbering.start_number = self.numbering_start_var.get()
+            numbering.padding = self.numbering_padding_var.get()
+        
+        case = ops['case']
+        case.enabled = self.case_enabled_var.get()
+        case.case_type = self.case_type_var.get()
+        
+        padding = ops['padding']
+        padding.enabled = self.padding_enabled_var.get()
+        if padding.enabled:
+            padding.padding_length = self.padding_length_var.get()
+        
+        ops['remove_padding'].enabled = self.remove_padding_enabled_var.get()
+        
+        return [op for op in ops.values() if op.enabled]
+    
+    def _schedule_preview(self, *args):
+        """Programa la actualización de la vista previa.
+        
+        Se llama desde las trazas de las variables de operaciones; mientras
+        se escribe o se cambian opciones solo se aplica el último estado.
+        """
+        self._cancel_scheduled_preview()
+        self._preview_after = self.rename_frame.after(self.PREVIEW_DEBOUNCE_MS, self.update_preview)
+    
+    def _cancel_scheduled_preview(self):
+        """Cancela la actualización programada de la vista previa."""
+        if self._preview_after is not None:
+            self.rename_frame.after_cancel(self._preview_after)
+            self._preview_after = None
     
     def update_preview(self):
         """Actualiza la vista previa de renombrado."""
-        if not self.renamer.files:
-            self.clear_preview()
-            return
+        self._cancel_scheduled_preview()
         
         try:
-            # Actualizar operaciones
-            self.update_operations()
-            
-            # Generar vista previa
-            self.current_preview = self.renamer.generate_preview()
+            operations = self.update_operations()
             
             # Actualizar vista previa de numeración
             if self.numbering_enabled_var.get():
@@ -657,29 +679,120 @@ class RenameTab:
                 padding = self.numbering_padding_var.get()
                 example = str(start).zfill(padding) + "_archivo.ext"
                 self.numbering_preview_label.config(text=example)
-            
-            # Actualizar Treeview
-            self.update_preview_tree()
-            
-            # Verificar conflictos
-            conflicts = self.renamer.check_conflicts()
-            total_conflicts = len(conflicts['duplicates']) + len(conflicts['existing_files']) + len(conflicts['invalid_names'])
-            
-            # Actualizar estadísticas
-            valid_files = len([p for p in self.current_preview if not p.has_conflict])
-            self.update_file_stats(len(self.current_preview), valid_files, total_conflicts)
-            
-        except Exception as e:
+        except tk.TclError as e:
+            # Valor no numérico a medio escribir en un Spinbox
             self.logger.log_operation('ERROR', f"Error actualizando vista previa: {str(e)}")
+            return
+        
+        # Sin operaciones habilitadas la vista previa solo repite los nombres
+        # originales: si ya se muestra y no hay otro trabajo después, no se
+        # regenera
+        if not operations and self._identity_job == self._job_id:
+            return
+        
+        self._submit_job(self._preview_worker, self._on_preview_error, operations)
     
-    def update_preview_tree(self):
-        """Actualiza el Treeview de vista previa."""
-        # Limpiar árbol
-        for item in self.preview_tree.get_children():
-            self.preview_tree.delete(item)
+    def _preview_worker(self, job_id: int, operations: List[RenameOperation]):
+        """Genera la vista previa y sus conflictos (hilo de trabajo).
+        
+        Devuelve None si no hay archivos cargados o si el trabajo ya fue
+        reemplazado por otro más reciente.
+        """
+        if job_id != self._job_id or not self.renamer.files:
+            return None
+        
+        self.renamer.set_operations(operations)
+        previews = self.renamer.generate_preview()
+        return previews, self.renamer.check_conflicts(), not operations
+    
+    def _on_preview_error(self, error_msg: str):
+        """Registra un error al generar la vista previa."""
+        self.logger.log_operation('ERROR', f"Error actualizando vista previa: {error_msg}")
+    
+    def _submit_job(self, worker: Callable, on_error: Callable, *args):
+        """Envía un trabajo al hilo de trabajo y descarta los resultados obsoletos."""
+        self._job_id += 1
+        job_id = self._job_id
+        
+        try:
+            future = self._worker.submit(worker, job_id, *args)
+        except RuntimeError:
+            # El hilo de trabajo ya se cerró: la aplicación está terminando
+            return
+        future.add_done_callback(
+            lambda f: self._deliver_result(f, on_error, self._on_preview_ready, job_id)
+        )
+    
+    def _deliver_result(self, future, on_error: Callable, on_done: Callable, *args):
+        """Pasa el resultado de un trabajo al hilo principal.
+        
+        Llama a ``on_done(*args, resultado)`` o a ``on_error(mensaje)``.
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        try:
+            if error is not None:
+                self.rename_frame.after(0, on_error, str(error))
+            else:
+                self.rename_frame.after(0, on_done, *args, future.result())
+        except (RuntimeError, tk.TclError):
+            # La ventana ya se destruyó
+            pass
+    
+    def shutdown(self):
+        """Detiene el hilo de trabajo descartando los trabajos pendientes."""
+        self._worker.shutdown(wait=False, cancel_futures=True)
+    
+    def _on_preview_ready(self, job_id: int, result):
+        """Muestra la vista previa si sigue siendo la más reciente."""
+        if job_id != self._job_id:
+            return
+        
+        if result is None:
+            self.clear_preview()
+            self.update_file_stats(0, 0, 0)
+            return
         
-        # Agregar elementos
-        for preview in self.current_preview:
+        self.current_preview, self.current_conflicts, identity = result
+        self._identity_job = job_id if identity else -1
+        
+        # Actualizar Treeview
+        self.update_preview_tree()
+        
+        # Actualizar estadísticas
+        conflicts = self.current_conflicts
+        total_conflicts = len(conflicts['duplicates']) + len(conflicts['existing_files']) + len(conflicts['invalid_names'])
+        valid_files = len([p for p in self.current_preview if not p.has_conflict])
+        self.update_file_stats(len(self.current_preview), valid_files, total_conflicts)
+        
+        if not self.is_processing:
+            self.status_label.config(text=f"Vista previa: {len(self.current_preview)} archivos")
+    
+    @staticmethod
+    def _empty_conflicts() -> Dict[str, List[str]]:
+        """Resultado de conflictos vacío."""
+        return {'duplicates': [], 'existing_files': [], 'invalid_names': []}
+    
+    def update_preview_tree(self):
+        """Actualiza el Treeview de vista previa.
+        
+        Funciona como lista virtual: solo se insertan las primeras filas y
+        el resto se agrega por bloques cuando el desplazamiento se acerca
+        al final, así Tk no guarda miles de elementos que nadie mira.
+        """
+        # Limpiar árbol con una sola llamada
+        self._clear_tree()
+        self._load_more_rows()
+    
+    def _load_more_rows(self):
+        """Inserta el siguiente bloque de filas de la vista previa."""
+        self._tree_load_pending = False
+        start = self._tree_loaded
+        end = min(start + self.PREVIEW_TREE_CHUNK, len(self.current_preview))
+        
+        insert = self.preview_tree.insert
+        for preview in self.current_preview[start:end]:
             # Determinar estado y tag
             if preview.has_conflict:
                 status = "⚠️ Conflicto"
@@ -691,29 +804,41 @@ class RenameTab:
                 status = "✅ Listo"
                 tag = 'success'
             
-            # Formatear tamaño
-            size_str = FileUtils.format_file_size(preview.size) if preview.size else "-"
+            # Tamaño ya formateado al cargar
+            size_str = preview.size_text if preview.size else "-"
             
-            # Insertar elemento
-            self.preview_tree.insert('', 'end', values=(
-                preview.original_name,
-                preview.new_name,
-                status,
-                size_str
-            ), tags=(tag,))
+            insert('', 'end', values=(preview.original_name, preview.new_name, status, size_str),
+                   tags=(tag,))
+        
+        self._tree_loaded = end
+    
+    def _on_tree_yscroll(self, first: str, last: str):
+        """Actualiza la barra de desplazamiento y carga más filas cerca del final."""
+        self._v_scrollbar.set(first, last)
+        if (not self._tree_load_pending
+                and self._tree_loaded < len(self.current_preview)
+                and float(last) >= self.PREVIEW_TREE_PREFETCH):
+            self._tree_load_pending = True
+            self.rename_frame.after_idle(self._load_more_rows)
+    
+    def _clear_tree(self):
+        """Vacía el Treeview."""
+        self._tree_loaded = 0
+        children = self.preview_tree.get_children()
+        if children:
+            self.preview_tree.delete(*children)
     
     def clear_preview(self):
         """Limpia la vista previa."""
-        for item in self.preview_tree.get_children():
-            self.preview_tree.delete(item)
-        self.current_preview.clear()
+        self._clear_tree()
+        self.current_preview = []
+        self.current_conflicts = self._empty_conflicts()
+        self._identity_job = -1
     
     def check_conflicts(self):
         """Verifica y muestra conflictos."""
-        if not self.current_preview:
-            self.update_preview()
-        
-        conflicts = self.renamer.check_conflicts()
+        # Los conflictos se calculan junto con cada vista previa
+        conflicts = self.current_conflicts
         
         # Crear mensaje de conflictos
         messages = []
@@ -735,38 +860,66 @@ class RenameTab:
             messagebox.showwarning("Advertencia", "No hay archivos para renombrar.")
             return
         
+        # Se renombra exactamente la vista previa mostrada: ninguna vista
+        # previa pendiente puede reemplazarla mientras se confirma
+        self._freeze_preview()
+        previews = list(self.current_preview)
+        
         # Verificar conflictos
-        conflicts = self.renamer.check_conflicts()
+        conflicts = self.current_conflicts
         total_conflicts = len(conflicts['duplicates']) + len(conflicts['existing_files']) + len(conflicts['invalid_names'])
         
         if total_conflicts > 0:
             if not messagebox.askyesno("Conflictos Detectados", 
                                      f"Se detectaron {total_conflicts} conflictos. ¿Continuar de todos modos?"):
+                self.update_preview()
                 return
         
         # Confirmar operación
-        valid_files = len([p for p in self.current_preview if not p.has_conflict and p.original_name != p.new_name])
+        valid_files = len([p for p in previews if not p.has_conflict and p.original_name != p.new_name])
         if not messagebox.askyesno("Confirmar Renombrado", 
                                  f"¿Renombrar {valid_files} archivos?"):
+            self.update_preview()
             return
         
-        # Ejecutar renombrado en hilo separado
+        # Ejecutar renombrado en el hilo de trabajo con las vistas previas
+        # confirmadas
+        self._freeze_preview()
         self.is_processing = True
         self.rename_button.config(state='disabled')
         self.status_label.config(text="Renombrando archivos...")
+        self._rename_progress = None
+        self._progress_pct = -1
+        self.progress_var.set(0)
         
-        def rename_thread():
-            try:
-                results = self.renamer.apply_rename(dry_run=False)
-                
-                # Actualizar UI en hilo principal
-                self.rename_frame.after(0, lambda: self.on_rename_complete(results))
-                
-            except Exception as e:
-                self.rename_frame.after(0, lambda: self.on_rename_error(str(e)))
-        
-        self.processing_thread = threading.Thread(target=rename_thread, daemon=True)
-        self.processing_thread.start()
+        try:
+            future = self._worker.submit(self.renamer.apply_rename, dry_run=False,
+                                         progress_callback=self._on_rename_progress,
+                                         previews=previews)
+        except RuntimeError:
+            return
+        self._pump_progress()
+        future.add_done_callback(
+            lambda f: self._deliver_result(f, self.on_rename_error, self.on_rename_complete)
+        )
+    
+    def _on_rename_progress(self, done: int, total: int):
+        """Registra el progreso del renombrado (hilo de trabajo, no toca Tk)."""
+        self._rename_progress = (done, total)
+    
+    def _pump_progress(self):
+        """Muestra el progreso del renombrado mientras dura, solo si cambió."""
+        state = self._rename_progress
+        if state is not None:
+            done, total = state
+            pct = done * 100 // total
+            if pct != self._progress_pct:
+                self._progress_pct = pct
+                self.progress_var.set(pct)
+                self.status_label.config(text=f"Renombrando archivos... {done}/{total}")
+        
+        if self.is_processing:
+            self.rename_frame.after(self.PROGRESS_INTERVAL_MS, self._pump_progress)
     
     def dry_run_rename(self):
         """Ejecuta una simulación del renombrado."""
@@ -774,24 +927,49 @@ class RenameTab:
             messagebox.showwarning("Advertencia", "No hay archivos para simular.")
             return
         
+        # Simular exactamente la vista previa mostrada
+        self._freeze_preview()
+        
         try:
-            results = self.renamer.apply_rename(dry_run=True)
-            
-            # Mostrar resultados
-            message = f"Simulación completada:\n\n"
-            message += f"Exitosos: {len(results['success'])}\n"
-            message += f"Errores: {len(results['errors'])}\n"
-            message += f"Omitidos: {len(results['skipped'])}"
-            
-            messagebox.showinfo("Simulación Completada", message)
-            
-        except Exception as e:
-            messagebox.showerror("Error en Simulación", f"Error: {str(e)}")
+            future = self._worker.submit(self.renamer.apply_rename, dry_run=True,
+                                         previews=list(self.current_preview))
+        except RuntimeError:
+            return
+        future.add_done_callback(
+            lambda f: self._deliver_result(f, self._on_dry_run_error, self._on_dry_run_complete)
+        )
+    
+    def _freeze_preview(self):
+        """Descarta la vista previa programada y los trabajos de vista previa en cola.
+        
+        Tras esto la vista previa mostrada no cambia hasta el siguiente
+        update_preview o load_files.
+        """
+        self._cancel_scheduled_preview()
+        self._job_id += 1
+    
+    def _on_dry_run_complete(self, results):
+        """Muestra el resultado de la simulación."""
+        message = f"Simulación completada:\n\n"
+        message += f"Exitosos: {len(results['success'])}\n"
+        message += f"Errores: {len(results['errors'])}\n"
+        message += f"Omitidos: {len(results['skipped'])}"
+        
+        messagebox.showinfo("Simulación Completada", message)
+        
+        # Recuperar los cambios de operaciones descartados durante la simulación
+        self.update_preview()
+    
+    def _on_dry_run_error(self, error_msg: str):
+        """Muestra un error de la simulación."""
+        messagebox.showerror("Error en Simulación", f"Error: {error_msg}")
+        self.update_preview()
     
     def on_rename_complete(self, results):
         """Maneja la finalización del renombrado."""
         self.is_processing = False
         self.rename_button.config(state='normal')
+        self.progress_var.set(100)
         
         # Mostrar resultados
         message = f"Renombrado completado:\n\n"
@@ -818,6 +996,9 @@ class RenameTab:
         
         messagebox.showerror("Error", f"Error durante el renombrado: {error_msg}")
         self.logger.log_operation('ERROR', f"Error en renombrado: {error_msg}")
+        
+        # Parte de los archivos pudo renombrarse: recargar la vista
+        self.load_files()
     
     # Operaciones de texto avanzadas
     def remove_accents(self):
@@ -842,24 +1023,29 @@ class RenameTab:
             messagebox.showwarning("Advertencia", "No hay archivos cargados.")
             return
         
-        try:
-            # Aplicar operación a cada archivo
-            modified_files = []
-            for file_path in self.renamer.files:
-                path = Path(file_path)
-                name, ext = os.path.splitext(path.name)
-                new_name = operation_func(name) + ext
-                new_path = path.parent / new_name
-                modified_files.append(str(new_path))
-            
-            # Actualizar lista de archivos
-            self.renamer.files = modified_files
-            self.update_preview()
-            
-            self.logger.log_operation('INFO', f"Operación de texto aplicada a {len(modified_files)} archivos")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error aplicando operación: {str(e)}")
+        self._submit_job(self._text_operation_worker, self._on_text_operation_error,
+                         operation_func, self.update_operations())
+    
+    def _text_operation_worker(self, job_id: int, operation_func: Callable,
+                               operations: List[RenameOperation]):
+        """Aplica una operación de texto a la lista de archivos (hilo de trabajo)."""
+        # Aplicar operación a cada archivo
+        modified_files = []
+        for file_path in self.renamer.files:
+            path = Path(file_path)
+            name, ext = os.path.splitext(path.name)
+            new_name = operation_func(name) + ext
+            new_path = path.parent / new_name
+            modified_files.append(str(new_path))
+        
+        # Actualizar lista de archivos
+        self.renamer.files = modified_files
+        self.logger.log_operation('INFO', f"Operación de texto aplicada a {len(modified_files)} archivos")
+        return self._preview_worker(job_id, operations)
+    
+    def _on_text_operation_error(self, error_msg: str):
+        """Muestra un error de una operación de texto."""
+        messagebox.showerror("Error", f"Error aplicando operación: {error_msg}")
     
     def save_settings(self):
         """Guarda la configuración actual."""
@@ -76,7 +76,9 @@ def check_dependencies():
     optional_deps_list = {
         'ttkthemes': 'Temas modernos para la interfaz',
         'psutil': 'Información del sistema',
-        'pillow': 'Manejo de imágenes'
+        'pillow': 'Manejo de imágenes',
+        'orjson': 'Lectura JSON más rápida en actualizaciones',
+        'zstandard': 'Paquetes de actualización .tar.zst'
     }
     
     for dep, description in optional_deps_list.items():
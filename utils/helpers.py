@@ -14,12 +14,14 @@ from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timedelta
 import hashlib
 import json
+from functools import lru_cache
 
 
 class FileUtils:
     """Utilidades para manejo de archivos."""
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def format_file_size(size_bytes: int) -> str:
         """Formatea el tamaño de archivo en unidades legibles.
         
@@ -32,13 +34,13 @@ class FileUtils:
         if size_bytes == 0:
             return "0 B"
         
-        units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-        unit_index = 0
-        size = float(size_bytes)
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
+        units = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+        # Cada 10 bits de magnitud equivalen a un múltiplo de 1024
+        if size_bytes < 1024:
+            unit_index = 0
+        else:
+            unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(units) - 1)
+        size = size_bytes / (1 << (10 * unit_index))
         
         if unit_index == 0:
             return f"{int(size)} {units[unit_index]}"